@@ -8,7 +8,81 @@ Approach:
 - Return False on first mismatch
 Time: O(n) - Iterate through the entire string. 
 Space: O(1) - constant extra space. 
+
+File mode (is_palindrome_file):
+- Memory-map the file and move two byte cursors inward, one block at a time
+- Normalize each block (keep alphanumerics, lowercase) and compare the
+  front block against the reversed back block in bulk
+- Blocks are cut on UTF-8 character boundaries, so at most one block per
+  side is ever decoded
+Time: O(n) - every byte is read once.
+Space: O(block_size) - independent of the file size.
+
+Batch mode (is_palindrome_batch):
+- Concatenate many ASCII strings into one flat byte buffer plus offsets
+- Lowercase and drop non-alphanumerics for the whole buffer at once,
+  remapping the offsets with a prefix sum
+- Compare every kept character with its mirror inside its own string and
+  reduce the mismatches per string with another prefix sum
+- Non-ASCII strings fall back to is_palindrome so results match exactly
+Time: O(total characters) - with no per-character Python work.
+Space: O(chunk_size * average length) - strings are processed in chunks.
+
+Substring index (PalindromeIndex):
+- Normalize the document once and record kept_before[p], the number of
+  alphanumerics in text[:p], which maps original positions to positions in
+  the normalized sequence
+- Run Manacher's algorithm on the normalized sequence: radii[c] is the
+  length of the longest palindrome centered at c (odd centers on
+  characters, even centers between them)
+- text[i:j] maps to the normalized range [a, b) and is a palindrome exactly
+  when the longest palindrome centered at a + b covers it:
+  radii[a + b] >= b - a
+- Batches of (start, stop) arrays are answered with array indexing
+Time: O(n) - to build; O(1) - per query.
+Space: O(n) - for kept_before and the radii.
 """
+import mmap
+import os
+import tempfile
+from array import array
+from itertools import accumulate
+from typing import BinaryIO, Iterable, List, Optional, Sequence, Tuple, Union
+
+# NumPy is optional and only imported by the batch code paths, so the
+# scalar functions never pay for loading it
+np = None
+_numpy_missing = False
+
+
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+# Default number of bytes read from each end of the file per step
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# Every ASCII byte that is not alphanumeric. Deleting these with
+# bytes.translate() is the bulk equivalent of the isalnum() skip loops.
+_ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+
+# Default number of strings normalized together by is_palindrome_batch
+DEFAULT_BATCH_CHUNK = 1 << 16
+
+# byte -> 1 if it is an ASCII alphanumeric else 0, as a bytes.translate() table
+_ASCII_ALNUM_FLAGS = bytes(b < 128 and chr(b).isalnum() for b in range(256))
+
 
 def is_palindrome(s: str) -> bool:
     """
@@ -43,6 +117,362 @@ def is_palindrome(s: str) -> bool:
     return True
 
 
+# ────────────────────────────────────────────────
+# File / Stream Mode
+# ────────────────────────────────────────────────
+def _normalize_block(block: bytes) -> Union[str, List[str]]:
+    """
+    Keep only the alphanumeric characters of a UTF-8 block, lowercased.
+
+    ASCII blocks (the common case for logs) are normalized entirely in C
+    with bytes.translate() and bytes.lower(). Other blocks are decoded and
+    normalized per character, exactly like is_palindrome does.
+
+    Args:
+        block (bytes): UTF-8 bytes cut on a character boundary
+
+    Returns:
+        str or List[str]: Normalized characters. A list is only returned
+        when some character lowercases to more than one code point, so that
+        comparisons still happen one original character at a time.
+    """
+    if block.isascii():
+        return block.translate(None, _ASCII_NON_ALNUM).lower().decode("ascii")
+
+    chars = [c.lower() for c in block.decode("utf-8") if c.isalnum()]
+    if all(len(c) == 1 for c in chars):
+        return "".join(chars)
+    return chars
+
+
+def _same_sequence(a: Sequence[str], b: Sequence[str]) -> bool:
+    """
+    Compare two normalized slices that may be a mix of str and List[str].
+    """
+    if type(a) is not type(b):
+        return list(a) == list(b)
+    return a == b
+
+
+def _is_palindrome_mapped(data: Union[bytes, mmap.mmap], block_size: int) -> bool:
+    """
+    Two-cursor palindrome check over a bytes-like object, block by block.
+
+    Args:
+        data: Memory-mapped file (or any bytes-like object) holding UTF-8
+        block_size (int): Maximum number of bytes decoded per side per step
+
+    Returns:
+        bool: True if palindrome, False otherwise
+    """
+    # Byte cursors: [left, right) is the part of the file not read yet
+    left = 0
+    right = len(data)
+
+    # Normalized characters read from the front, in file order, and from
+    # the back, in reverse file order. front_pos / back_pos mark how many
+    # of them have already been matched.
+    front, front_pos = "", 0
+    back, back_pos = "", 0
+
+    while True:
+        # Refill the front block, moving the cut back so that it never
+        # splits a UTF-8 character (continuation bytes look like 0b10xxxxxx)
+        if front_pos == len(front) and left < right:
+            end = min(left + block_size, right)
+            while end < right and data[end] & 0xC0 == 0x80:
+                end -= 1
+            front, front_pos = _normalize_block(data[left:end]), 0
+            left = end
+
+        # Refill the back block, moving the cut forward for the same reason
+        if back_pos == len(back) and left < right:
+            start = max(right - block_size, left)
+            while start < right and data[start] & 0xC0 == 0x80:
+                start += 1
+            back, back_pos = _normalize_block(data[start:right])[::-1], 0
+            right = start
+
+        front_left = len(front) - front_pos
+        back_left = len(back) - back_pos
+
+        if front_left == 0 or back_left == 0:
+            # One side ran dry but there are unread bytes: read more
+            if left < right:
+                continue
+
+            # Both cursors met. Whatever is left unmatched in the other
+            # block is the middle of the file and must mirror itself.
+            middle = front[front_pos:] if front_left else back[back_pos:]
+            return _same_sequence(middle, middle[::-1])
+
+        # Compare as many characters as both blocks have in one slice
+        # comparison instead of one character at a time
+        step = min(front_left, back_left)
+        if not _same_sequence(front[front_pos:front_pos + step],
+                              back[back_pos:back_pos + step]):
+            return False
+        front_pos += step
+        back_pos += step
+
+
+def is_palindrome_file(source: Union[str, bytes, os.PathLike, BinaryIO],
+                       block_size: int = DEFAULT_BLOCK_SIZE) -> bool:
+    """
+    Determine if a UTF-8 text file is a palindrome, using the same rules as
+    is_palindrome (alphanumerics only, case-insensitive).
+
+    The file is memory-mapped and read from both ends toward the center,
+    so peak memory depends on block_size and not on the file size.
+
+    Args:
+        source: Path to the file, or a binary file object with a fileno()
+        block_size (int): Bytes read from each end per step (at least 4,
+            the longest UTF-8 character)
+
+    Returns:
+        bool: True if palindrome, False otherwise
+    """
+    if block_size < 4:
+        raise ValueError("block_size must be at least 4 bytes")
+
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "rb") as f:
+            return is_palindrome_file(f, block_size)
+
+    # mmap cannot map an empty file
+    if os.fstat(source.fileno()).st_size == 0:
+        return True
+
+    with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return _is_palindrome_mapped(data, block_size)
+
+
+# ────────────────────────────────────────────────
+# Batch Mode
+# ────────────────────────────────────────────────
+def _is_palindrome_ascii(s: str) -> bool:
+    """
+    is_palindrome for an ASCII string, normalized in C instead of a loop.
+    """
+    t = s.encode("ascii").translate(None, _ASCII_NON_ALNUM).lower()
+    return t == t[::-1]
+
+
+def _ascii_batch_numpy(strings: List[str]) -> "np.ndarray":
+    """
+    Vectorized palindrome check of many ASCII strings at once.
+
+    Args:
+        strings (List[str]): ASCII strings
+
+    Returns:
+        np.ndarray: Boolean array, one entry per string
+    """
+    # Flat buffer of every character, lowercased in one call
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    flat = "".join(strings).lower().encode("ascii")
+
+    # Normalized buffer: only the alphanumerics, removed in one call
+    codes = np.frombuffer(flat.translate(None, _ASCII_NON_ALNUM), dtype=np.uint8)
+
+    # kept_before[p] = number of alphanumerics in flat[:p], which turns the
+    # original string offsets into offsets inside the normalized buffer
+    kept_before = np.zeros(len(flat) + 1, dtype=np.intp)
+    flags = np.frombuffer(flat.translate(_ASCII_ALNUM_FLAGS), dtype=np.uint8)
+    np.cumsum(flags, out=kept_before[1:])
+    ends = kept_before[np.cumsum(lengths)]
+    starts = np.concatenate(([0], ends[:-1]))
+
+    # Mirror of position p inside its string: start + (end - 1) - p
+    mirror = np.repeat(starts + ends - 1, ends - starts) - np.arange(codes.size)
+
+    # A string is a palindrome when none of its characters differ from
+    # their mirror, i.e. the running mismatch count does not grow across it
+    mismatches = np.zeros(codes.size + 1, dtype=np.intp)
+    np.cumsum(codes != codes[mirror], out=mismatches[1:])
+    return mismatches[ends] == mismatches[starts]
+
+
+def is_palindrome_batch(strings: Iterable[str],
+                        chunk_size: int = DEFAULT_BATCH_CHUNK):
+    """
+    Run is_palindrome over many strings at once.
+
+    ASCII strings are normalized and compared with array operations over
+    one flat buffer per chunk; any other string is checked with
+    is_palindrome itself, so every answer matches the scalar function.
+
+    Args:
+        strings: List, tuple or NumPy column of strings
+        chunk_size (int): Number of strings normalized together (bounds
+            the size of the temporary arrays)
+
+    Returns:
+        np.ndarray of bool, or List[bool] when NumPy is not installed
+    """
+    strings = list(strings)
+
+    if _numpy() is None:
+        return [_is_palindrome_ascii(s) if s.isascii() else is_palindrome(s)
+                for s in strings]
+
+    result = np.empty(len(strings), dtype=bool)
+    for begin in range(0, len(strings), chunk_size):
+        chunk = strings[begin:begin + chunk_size]
+        out = result[begin:begin + len(chunk)]
+
+        # Fast path: the whole chunk is ASCII (checked in one C call)
+        if "".join(chunk).isascii():
+            out[:] = _ascii_batch_numpy(chunk)
+            continue
+
+        ascii_pos = [i for i, s in enumerate(chunk) if s.isascii()]
+        for i, s in enumerate(chunk):
+            if not s.isascii():
+                out[i] = is_palindrome(s)
+        if ascii_pos:
+            out[ascii_pos] = _ascii_batch_numpy([chunk[i] for i in ascii_pos])
+
+    return result
+
+
+# ────────────────────────────────────────────────
+# Substring Index
+# ────────────────────────────────────────────────
+def _manacher(seq: Sequence) -> array:
+    """
+    Longest palindrome length around every center of seq.
+
+    Args:
+        seq: Sequence of comparable items (bytes, str or list)
+
+    Returns:
+        array: radii of length 2 * len(seq) + 1; radii[2c + 1] is the
+        longest odd palindrome centered on seq[c], radii[2c] the longest
+        even palindrome centered just before seq[c]
+    """
+    m = len(seq)
+    radii = array("q", bytes(8 * (2 * m + 1)))
+
+    # Odd palindromes: [left, right] is the rightmost palindrome found so far
+    odd = [0] * m
+    left, right = 0, -1
+    for i in range(m):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < m and seq[i - k] == seq[i + k]:
+            k += 1
+        odd[i] = k
+        radii[2 * i + 1] = 2 * k - 1
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    # Even palindromes, centered between seq[i - 1] and seq[i]
+    even = [0] * m
+    left, right = 0, -1
+    for i in range(m):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < m and seq[i - k - 1] == seq[i + k]:
+            k += 1
+        even[i] = k
+        radii[2 * i] = 2 * k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return radii
+
+
+class PalindromeIndex:
+    """
+    Answers "is text[i:j] a palindrome?" in O(1) after O(n) preprocessing,
+    with the same rules as is_palindrome (alphanumerics only, ignoring case).
+
+    Example:
+        index = PalindromeIndex("xx A man, a plan, a canal: Panama yy")
+        index.query(3, 33)                  # True
+        index.query(0, 33)                  # False
+        index.query_batch([3, 0], [33, 33]) # [True, False]
+    """
+
+    def __init__(self, text: str) -> None:
+        """
+        Args:
+            text (str): Document to index
+        """
+        self._n = len(text)
+
+        if text.isascii():
+            # Normalize in C; indexing bytes yields ints, which compare fast
+            raw = text.encode("ascii")
+            normalized = raw.translate(None, _ASCII_NON_ALNUM).lower()
+            flags = raw.translate(_ASCII_ALNUM_FLAGS)
+        else:
+            # One item per kept character, as is_palindrome compares them
+            normalized = [c.lower() for c in text if c.isalnum()]
+            flags = [c.isalnum() for c in text]
+
+        # kept_before[p] = number of alphanumerics in text[:p]
+        self._kept_before = array("q", accumulate(flags, initial=0))
+        self._radii = _manacher(normalized)
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _bounds(self, start: int, stop: int) -> Tuple[int, int]:
+        """
+        Normalized range [a, b) of text[start:stop] (slice semantics).
+        """
+        start, stop, _ = slice(start, stop).indices(self._n)
+        return self._kept_before[start], self._kept_before[max(start, stop)]
+
+    def query(self, start: int = 0, stop: Optional[int] = None) -> bool:
+        """
+        True if text[start:stop] is a palindrome. O(1).
+
+        Args:
+            start (int): Start of the range (negative counts from the end)
+            stop (int): End of the range, exclusive (default: end of text)
+
+        Returns:
+            bool: Same answer as is_palindrome(text[start:stop])
+        """
+        a, b = self._bounds(start, stop)
+        return b - a <= 1 or self._radii[a + b] >= b - a
+
+    def query_batch(self, starts, stops):
+        """
+        Answer many range queries at once.
+
+        Args:
+            starts: Sequence or integer array of range starts
+            stops: Sequence or integer array of range ends (exclusive)
+
+        Returns:
+            np.ndarray of bool, or List[bool] when NumPy is not installed
+        """
+        if _numpy() is None:
+            return [self.query(start, stop) for start, stop in zip(starts, stops)]
+
+        starts = np.asarray(starts, dtype=np.int64)
+        stops = np.asarray(stops, dtype=np.int64)
+        if starts.shape != stops.shape:
+            raise ValueError("starts and stops must have the same shape")
+
+        # Slice semantics: negative positions count from the end, then clip
+        n = self._n
+        starts = np.clip(np.where(starts < 0, starts + n, starts), 0, n)
+        stops = np.clip(np.where(stops < 0, stops + n, stops), 0, n)
+        stops = np.maximum(starts, stops)
+
+        # array.array exposes its buffer, so these are views, not copies
+        kept_before = np.frombuffer(self._kept_before, dtype=np.int64)
+        radii = np.frombuffer(self._radii, dtype=np.int64)
+
+        a = kept_before[starts]
+        b = kept_before[stops]
+        return (b - a <= 1) | (radii[a + b] >= b - a)
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -63,6 +493,27 @@ def main() -> None:
         print(f"Output: {is_palindrome(s)}")
         print("-" * 50)
 
+    # File mode: a tiny block size forces many block refills
+    for s in test_cases:
+        with tempfile.TemporaryFile() as f:
+            f.write(s.encode("utf-8"))
+            f.flush()
+            print(f"File  : {s}")
+            print(f"Output: {is_palindrome_file(f, block_size=4)}")
+            print("-" * 50)
+
+    # Batch mode: one call for every test case
+    print(f"Batch : {test_cases}")
+    print(f"Output: {[bool(r) for r in is_palindrome_batch(test_cases)]}")
+    print("-" * 50)
+
+    # Substring index: one preprocessing pass, then O(1) per range
+    document = "xx " + test_cases[0] + " yy"
+    index = PalindromeIndex(document)
+    print(f"Index : {document!r}")
+    print(f"Output: [3:33] -> {index.query(3, 33)}, [0:33] -> {index.query(0, 33)}")
+    print("-" * 50)
+
 
 if __name__ == "__main__":
     main()
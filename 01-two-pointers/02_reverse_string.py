@@ -10,8 +10,23 @@ Time: O(n) - Iterate through half the array, Where n is the length of the
 array.
 Space: O(1) - Constant extra space (in-place modification). No additional
 data structure required regardless of the input size.
+
+Buffer mode (reverse_buffer / reverse_file):
+- Same two pointers, but they move a whole chunk at a time
+- The left and right chunks are copied out, reversed in C (bytes slicing
+  or array.reverse) and written back into each other's place
+- Every copy is a memoryview slice assignment, so no Python list is built
+- reverse_file memory-maps the file and reverses the mapping in place
+Time: O(n) - every item is copied twice, at memcpy speed.
+Space: O(chunk_size) - one scratch buffer, regardless of the input size.
 """
-from typing import List
+import array
+import mmap
+import os
+from typing import List, Union
+
+# Default number of items moved per step by reverse_buffer
+DEFAULT_CHUNK_SIZE = 1 << 16
 
 
 def reverse_string(s: List[str]) -> None:
@@ -37,6 +52,133 @@ def reverse_string(s: List[str]) -> None:
         right -= 1
 
 
+# ────────────────────────────────────────────────
+# Buffer Mode
+# ────────────────────────────────────────────────
+def reverse_buffer(buf, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Reverse a writable buffer in-place, one chunk at a time.
+
+    Works with anything that exports a writable, contiguous, one-dimensional
+    buffer: bytearray, array.array, mmap.mmap, NumPy arrays, memoryview.
+    Items (not bytes) are reversed, so an array.array('i') keeps its ints.
+
+    Args:
+        buf: Writable buffer to reverse
+        chunk_size (int): Number of items swapped per step
+
+    Returns:
+        None: Modifies the buffer in-place
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    with memoryview(buf) as view:
+        if view.readonly:
+            raise TypeError("reverse_buffer() needs a writable buffer")
+        if view.ndim != 1 or not view.c_contiguous:
+            raise ValueError("reverse_buffer() needs a contiguous 1-D buffer")
+
+        # array.array can reverse typed items in C; remember its typecode
+        # when the buffer's item format is one it understands
+        typecode = view.format.lstrip("@")
+        if typecode not in array.typecodes or \
+                array.array(typecode).itemsize != view.itemsize:
+            typecode = None
+
+        # Work on the raw bytes; pointers still move in whole items
+        with view.cast("B") as raw:
+            _reverse_items(raw, view.itemsize, typecode, chunk_size)
+
+
+def _reversed_copy(chunk: memoryview, itemsize: int, typecode) -> bytes:
+    """
+    Reversed copy of a chunk of raw bytes holding whole items.
+
+    Args:
+        chunk (memoryview): Bytes of the items to reverse
+        itemsize (int): Size of one item in bytes
+        typecode: array.array typecode of the items, or None
+
+    Returns:
+        Bytes-like object with the items in reverse order
+    """
+    # 1-byte items: bytes slicing reverses in C
+    if itemsize == 1:
+        return chunk.tobytes()[::-1]
+
+    # Typed items: array.reverse() swaps whole items in C
+    if typecode is not None:
+        items = array.array(typecode)
+        items.frombytes(chunk)
+        items.reverse()
+        return memoryview(items).cast("B")
+
+    # Any other item format: reverse each byte lane separately, so the
+    # bytes inside an item keep their order
+    data = chunk.tobytes()
+    result = bytearray(len(data))
+    for lane in range(itemsize):
+        result[lane::itemsize] = data[lane::itemsize][::-1]
+    return result
+
+
+def _reverse_items(raw: memoryview, itemsize: int, typecode,
+                   chunk_size: int) -> None:
+    """
+    Chunked two-pointer reversal of a buffer viewed as raw bytes.
+
+    Args:
+        raw (memoryview): Writable byte view of the buffer
+        itemsize (int): Size of one item in bytes
+        typecode: array.array typecode of the items, or None
+        chunk_size (int): Number of items swapped per step
+    """
+    # Pointers count items; byte offsets are pointer * itemsize
+    left = 0
+    right = len(raw) // itemsize
+
+    while right - left > 1:
+        # Never let the two chunks overlap in the middle
+        step = min(chunk_size, (right - left) // 2)
+        left_slice = slice(left * itemsize, (left + step) * itemsize)
+        right_slice = slice((right - step) * itemsize, right * itemsize)
+
+        # Swap the left chunk and the right chunk, reversing both
+        left_chunk = _reversed_copy(raw[left_slice], itemsize, typecode)
+        raw[left_slice] = _reversed_copy(raw[right_slice], itemsize, typecode)
+        raw[right_slice] = left_chunk
+
+        # Move both pointers one chunk toward the center
+        left += step
+        right -= step
+
+
+def reverse_file(path: Union[str, bytes, os.PathLike],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """
+    Reverse the bytes of a file in-place through a memory map.
+
+    Only chunk_size bytes of scratch memory are used, so a multi-GB file is
+    reversed without loading it.
+
+    Args:
+        path: Path of the file to reverse
+        chunk_size (int): Number of bytes swapped per step
+
+    Returns:
+        None: Modifies the file in-place
+    """
+    with open(path, "r+b") as f:
+        # mmap cannot map an empty file, which is its own reverse anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0) as data:
+            reverse_buffer(data, chunk_size)
+            data.flush()
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -59,6 +201,19 @@ def main() -> None:
         print(f"Output: {s}")
         print("-" * 50)
 
+    # Buffer mode: bytearray and array.array are reversed without a list
+    buffers = [
+        bytearray(b"hello"),
+        array.array("i", [1, 2, 3, 4, 5, 6]),
+    ]
+
+    for buf in buffers:
+        original = buf[:]
+        reverse_buffer(buf, chunk_size=2)
+        print(f"Input : {original}")
+        print(f"Output: {buf}")
+        print("-" * 50)
+
 
 if __name__ == "__main__":
     main()
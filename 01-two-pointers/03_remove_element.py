@@ -10,8 +10,50 @@ Approach:
 Time: O(n) - Where n is the length of the array.This is because we iterate over nums only once.
 Space: O(1) - Constant extra space (in-place modification). No additional
 data structure required regardless of the input size.
+
+Bulk variant (remove_elements):
+- Same read/write pointers, but an element is dropped when it is in a set
+  of values or matches a predicate, so several values go in one pass
+- NumPy arrays and array.array buffers build a boolean keep-mask instead
+  and copy the kept elements into the prefix with one bulk assignment
+Time: O(n) - one pass, whatever the number of values removed.
+Space: O(1) for lists; O(n) temporary mask/copy for the array fast path.
 """
-from typing import List
+import array
+import sys
+from typing import Any, Callable, Iterable, List, Union
+
+# NumPy is optional and only imported by the array fast path, so
+# remove_element and list input never pay for loading it
+np = None
+_numpy_missing = False
+
+
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def _is_ndarray(obj) -> bool:
+    """
+    isinstance(obj, np.ndarray) without importing NumPy: an array can only
+    exist once NumPy has been loaded.
+    """
+    return sys.modules.get("numpy") is not None and isinstance(obj, _numpy().ndarray)
+
+
+# array.array typecodes that map directly onto a NumPy dtype
+_NUMERIC_TYPECODES = "bBhHiIlLqQfd"
 
 
 def remove_element(nums: List[int], val: int) -> int:
@@ -19,12 +61,17 @@ def remove_element(nums: List[int], val: int) -> int:
     Remove all occurrences of val in-place and return new length.
 
     Args:
-        nums (List[int]): Input list of integers to modify
+        nums (List[int]): Input list of integers to modify (a NumPy array
+            is compacted with one keep-mask, as in remove_elements)
         val (int): Value to remove from the list
 
     Returns:
         int: Number of elements not equal to val
     """
+    # NumPy input: compact the array with one keep-mask
+    if _is_ndarray(nums):
+        return _remove_masked(nums, lambda x: x == val, None)
+
     # Initialize k to track the position for non-val elements
     k = 0
 
@@ -41,6 +88,71 @@ def remove_element(nums: List[int], val: int) -> int:
     return k
 
 
+def remove_elements(nums, vals: Union[Iterable[Any], Callable[[Any], bool]]) -> int:
+    """
+    Remove, in a single pass, every element that is in vals (or for which
+    vals returns True) and return the new length.
+
+    Args:
+        nums: List, array.array or NumPy array to modify in-place
+        vals: Collection of values to remove, or a predicate. For a NumPy
+            array the predicate is called once with the whole array and must
+            return a boolean mask (e.g. lambda x: x < 0)
+
+    Returns:
+        int: Number of elements kept; they are in nums[:k], in order
+    """
+    is_drop = vals if callable(vals) else None
+    values = None if callable(vals) else set(vals)
+
+    # Fast path: NumPy arrays and numeric array.array buffers
+    if _is_ndarray(nums):
+        return _remove_masked(nums, is_drop, values)
+    if isinstance(nums, array.array) and is_drop is None \
+            and nums.typecode in _NUMERIC_TYPECODES and _numpy() is not None:
+        return _remove_masked(np.asarray(memoryview(nums)), None, values)
+
+    if isinstance(nums, array.array):
+        # One bulk copy of the kept elements into the prefix
+        if is_drop is None:
+            kept = array.array(nums.typecode, (x for x in nums if x not in values))
+        else:
+            kept = array.array(nums.typecode, (x for x in nums if not is_drop(x)))
+        nums[:len(kept)] = kept
+        return len(kept)
+
+    # Lists: the same read/write pointers as remove_element
+    k = 0
+    for j in range(len(nums)):
+        x = nums[j]
+        if not (x in values if is_drop is None else is_drop(x)):
+            nums[k] = x
+            k += 1
+    return k
+
+
+def _remove_masked(nums: "np.ndarray", is_drop, values) -> int:
+    """
+    Compact a 1-D NumPy array (or a NumPy view of a buffer) with a mask.
+
+    Args:
+        nums (np.ndarray): Array to modify in-place
+        is_drop: Vectorized predicate returning a boolean mask, or None
+        values: Set of values to remove when is_drop is None
+
+    Returns:
+        int: Number of elements kept
+    """
+    if is_drop is not None:
+        drop = np.asarray(is_drop(nums), dtype=bool)
+    else:
+        drop = np.isin(nums, list(values))
+
+    kept = nums[~drop]
+    nums[:kept.size] = kept
+    return int(kept.size)
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -61,6 +173,16 @@ def main() -> None:
         print("\tk:", remove_element(nums_arr[i], val_arr[i]))
         print("-"*100)
 
+    # Several values (or a predicate) removed in one pass
+    nums = [0, -1, 3, 99, 4, -1, 99, 5]
+    print("nums:", nums)
+    k = remove_elements(nums, {-1, 99})
+    print("vals: {-1, 99}\tk:", k, "\tkept:", nums[:k])
+    nums = nums[:k]
+    k = remove_elements(nums, lambda x: x == 0)
+    print("vals: x == 0\tk:", k, "\tkept:", nums[:k])
+    print("-"*100)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,9 +9,47 @@ Approach:
 Time: O(n) - Where n is the length of the array. This is because we iterate over nums only once.
 Space: O(1) - Constant extra space (in-place modification). No additional
 data structure required regardless of the input size.
+
+Streaming / external-memory variants:
+- iter_unique: the same "is it different from the last unique value?" test,
+  but over any sorted iterator, yielding unique values lazily
+- merge_unique: k-way merge of N sorted sources with a heap (heapq.merge),
+  dropping duplicates inside and across sources
+- dedupe_sorted_files: merge_unique over sorted text files (one value per
+  line), writing the result in large buffered batches
+Time: O(n log k) - for n values spread over k sources.
+Space: O(k) - one pending value (and one file buffer) per source.
+
+Online container (SortedUnique):
+- Keep the unique values as a list of sorted blocks of bounded size plus
+  the maximum of each block, so bisect finds the block of a value and then
+  its position inside that block
+- add() inserts only when the value is absent and splits a block that grows
+  past twice the load, so no insert shifts more than 2 * load values
+- update() merges a sorted chunk with merge_unique (the same duplicate test
+  as remove_duplicates) and re-cuts the blocks, unless the chunk is small
+  enough for one add() per value to be cheaper
+- Slices ([:k], [i:j]) are views that read the blocks in place
+Time: O(log n + load) - per contains/add; O(n + m) - per update of m values.
+Space: O(n) - plus one list of block maxima.
 """
 
-from typing import List
+import heapq
+import os
+from bisect import bisect_left, bisect_right
+from itertools import groupby, islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+# Default number of values joined into a single write() call
+DEFAULT_WRITE_BATCH = 1 << 14
+
+# Default buffer size for reading and writing sorted files
+DEFAULT_IO_BUFFER = 1 << 20
+
+PathLike = Union[str, bytes, os.PathLike]
+
+# Target number of values per SortedUnique block
+DEFAULT_BLOCK_LOAD = 1000
 
 
 def remove_duplicates(nums: List[int]) -> int:
@@ -42,6 +80,349 @@ def remove_duplicates(nums: List[int]) -> int:
     return i + 1
 
 
+# ────────────────────────────────────────────────
+# Streaming / External-Memory Variants
+# ────────────────────────────────────────────────
+def iter_unique(values: Iterable[Any]) -> Iterator[Any]:
+    """
+    Lazily yield the unique values of a sorted iterable.
+
+    Equivalent to nums[:remove_duplicates(nums)], but only the last unique
+    value is kept in memory, so the input can be an unbounded stream.
+
+    Args:
+        values: Iterable sorted in non-decreasing order
+
+    Returns:
+        Iterator over the unique values, in order
+    """
+    # groupby starts a new group exactly when a value differs from the
+    # previous one, which is the nums[j] != nums[i] test above, done in C
+    for value, _ in groupby(values):
+        yield value
+
+
+def read_sorted_file(path: PathLike, parse: Callable[[str], Any] = int,
+                     buffer_size: int = DEFAULT_IO_BUFFER) -> Iterator[Any]:
+    """
+    Lazily read a sorted text file that holds one value per line.
+
+    Args:
+        path: Path of the file
+        parse: Converts one line (without trailing whitespace) to a value
+        buffer_size (int): Size of the read buffer in bytes
+
+    Returns:
+        Iterator over the parsed values
+    """
+    with open(path, "r", buffering=buffer_size) as f:
+        yield from map(parse, map(str.rstrip, f))
+
+
+def merge_unique(*sources: Union[Iterable[Any], PathLike],
+                 parse: Callable[[str], Any] = int) -> Iterator[Any]:
+    """
+    K-way merge of sorted sources, yielding every distinct value once.
+
+    Args:
+        *sources: Sorted iterables, or paths of sorted files (one value per
+            line) which are read lazily with read_sorted_file
+        parse: Converts a line of a file source to a value
+
+    Returns:
+        Iterator over the unique values of all sources, in order
+    """
+    streams = [read_sorted_file(source, parse)
+               if isinstance(source, (str, bytes, os.PathLike)) else source
+               for source in sources]
+
+    # heapq.merge keeps one pending value per stream in a heap, so the
+    # duplicates from different shards end up next to each other
+    return iter_unique(heapq.merge(*streams))
+
+
+def dedupe_sorted_files(paths: Iterable[PathLike], out_path: PathLike,
+                        parse: Callable[[str], Any] = int,
+                        batch_size: int = DEFAULT_WRITE_BATCH) -> int:
+    """
+    Merge sorted shard files into one sorted file without duplicates.
+
+    Args:
+        paths: Paths of the sorted input files (one value per line)
+        out_path: Path of the output file
+        parse: Converts a line to a value (values are compared after parsing,
+            so "007" and "7" are duplicates with the default int)
+        batch_size (int): Number of output lines joined per write() call
+
+    Returns:
+        int: Number of unique values written
+    """
+    unique = merge_unique(*paths, parse=parse)
+    count = 0
+
+    with open(out_path, "w", buffering=DEFAULT_IO_BUFFER) as out:
+        while True:
+            batch = list(islice(unique, batch_size))
+            if not batch:
+                break
+            out.write("\n".join(map(str, batch)))
+            out.write("\n")
+            count += len(batch)
+
+    return count
+
+
+# ────────────────────────────────────────────────
+# Online Sorted-Unique Container
+# ────────────────────────────────────────────────
+class SortedUnique:
+    """
+    Mutable sorted set of values, stored in bisect-indexed blocks.
+
+    list(container) is always equal to nums[:remove_duplicates(nums)] for
+    the sorted list nums of every value ever added.
+
+    Example:
+        unique = SortedUnique([1, 1, 2, 5])
+        unique.add(3)             # True (inserted)
+        unique.add(5)             # False (already present)
+        unique.update([0, 2, 9])  # sorted chunk, merged in one pass
+        list(unique[:3])          # [0, 1, 2]
+    """
+
+    def __init__(self, values: Iterable[Any] = (), load: int = DEFAULT_BLOCK_LOAD) -> None:
+        """
+        Args:
+            values: Initial values (any order, duplicates allowed)
+            load (int): Target block size; blocks hold between 1 and
+                2 * load values
+        """
+        if load < 1:
+            raise ValueError("load must be at least 1")
+        self._load = load
+        self._blocks: List[List[Any]] = []
+        self._maxes: List[Any] = []     # _maxes[b] == _blocks[b][-1]
+        self._offsets: Optional[List[int]] = None   # prefix sums of block sizes, built lazily
+        self._len = 0
+        self._rebuild(iter_unique(sorted(values)))
+
+    def _rebuild(self, unique: Iterable[Any]) -> None:
+        """
+        Re-cut the blocks from an iterable of sorted unique values.
+        """
+        unique = iter(unique)
+        self._blocks = []
+        while True:
+            block = list(islice(unique, self._load))
+            if not block:
+                break
+            self._blocks.append(block)
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = sum(map(len, self._blocks))
+        self._offsets = None
+
+    def _locate(self, value: Any) -> int:
+        """
+        Index of the block that holds (or would hold) value.
+        """
+        b = bisect_left(self._maxes, value)
+        return b if b < len(self._blocks) else len(self._blocks) - 1
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, value: Any) -> bool:
+        if not self._blocks:
+            return False
+        block = self._blocks[self._locate(value)]
+        i = bisect_left(block, value)
+        return i < len(block) and block[i] == value
+
+    def __iter__(self) -> Iterator[Any]:
+        for block in self._blocks:
+            yield from block
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def add(self, value: Any) -> bool:
+        """
+        Insert value if it is absent.
+
+        Returns:
+            bool: True if the value was inserted, False if already present
+        """
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            self._len = 1
+            self._offsets = None
+            return True
+
+        b = self._locate(value)
+        block = self._blocks[b]
+        i = bisect_left(block, value)
+        if i < len(block) and block[i] == value:
+            return False
+
+        block.insert(i, value)
+        self._maxes[b] = block[-1]
+        self._len += 1
+        self._offsets = None
+
+        # Split an oversized block in two halves of `load` values
+        if len(block) > 2 * self._load:
+            half = block[self._load:]
+            del block[self._load:]
+            self._blocks.insert(b + 1, half)
+            self._maxes[b] = block[-1]
+            self._maxes.insert(b + 1, half[-1])
+        return True
+
+    def discard(self, value: Any) -> bool:
+        """
+        Remove value if it is present.
+
+        Returns:
+            bool: True if the value was removed
+        """
+        if not self._blocks:
+            return False
+        b = self._locate(value)
+        block = self._blocks[b]
+        i = bisect_left(block, value)
+        if i == len(block) or block[i] != value:
+            return False
+
+        del block[i]
+        if block:
+            self._maxes[b] = block[-1]
+        else:
+            del self._blocks[b]
+            del self._maxes[b]
+        self._len -= 1
+        self._offsets = None
+        return True
+
+    def update(self, values: Iterable[Any]) -> int:
+        """
+        Merge a sorted chunk of values (duplicates allowed) into the container.
+
+        Small chunks are inserted one by one; larger ones are merged with
+        the current contents in a single O(n + m) pass.
+
+        Args:
+            values: Values sorted in non-decreasing order
+
+        Returns:
+            int: Number of values actually inserted
+
+        Raises:
+            ValueError: If the chunk is not sorted (checked in O(m) before
+                anything is inserted, since the merge trusts the order)
+        """
+        chunk = values if isinstance(values, list) else list(values)
+        if any(later < earlier for earlier, later in zip(chunk, islice(chunk, 1, None))):
+            raise ValueError("update() needs values sorted in non-decreasing order")
+        before = self._len
+
+        # m inserts cost about m * load shifts; a merge costs n + m
+        if len(chunk) * self._load < self._len:
+            for value in chunk:
+                self.add(value)
+        else:
+            self._rebuild(merge_unique(list(self), chunk))
+
+        return self._len - before
+
+    def _position(self, index: int):
+        """
+        (block, position in block) of the value at a global index.
+        """
+        if self._offsets is None:
+            offsets = [0]
+            for block in self._blocks:
+                offsets.append(offsets[-1] + len(block))
+            self._offsets = offsets
+        b = bisect_right(self._offsets, index) - 1
+        return b, index - self._offsets[b]
+
+    def __getitem__(self, index):
+        """
+        container[i] is the i-th smallest value; container[i:j] is a view.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step != 1:
+                raise ValueError("SortedUnique slices do not support a step")
+            return SortedUniqueView(self, start, max(start, stop))
+
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedUnique index out of range")
+        b, i = self._position(index)
+        return self._blocks[b][i]
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Any]:
+        """
+        Values at global indexes [start, stop), read from the blocks.
+        """
+        if start >= stop:
+            return
+        b, i = self._position(start)
+        remaining = stop - start
+        while remaining > 0:
+            block = self._blocks[b]
+            end = min(len(block), i + remaining)
+            for j in range(i, end):
+                yield block[j]
+            remaining -= end - i
+            b, i = b + 1, 0
+
+
+class SortedUniqueView:
+    """
+    Zero-copy view of the index range [start, stop) of a SortedUnique.
+
+    The view reads the container's blocks on demand, so it reflects later
+    changes to the container (like dict views); list(view) makes a copy.
+    """
+
+    def __init__(self, container: SortedUnique, start: int, stop: int) -> None:
+        self._container = container
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return max(0, min(self._stop, len(self._container)) - self._start)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._container._iter_range(self._start, self._start + len(self))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("SortedUnique slices do not support a step")
+            return SortedUniqueView(self._container, self._start + start,
+                                    self._start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SortedUniqueView index out of range")
+        return self._container[self._start + index]
+
+    def __eq__(self, other) -> bool:
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -66,6 +447,21 @@ def main():
         print("\tArray After Removing Duplicates:", arr[:k])
         print("-" * 55)
 
+    # Streaming: unique values of several sorted shards, merged lazily
+    shards = [[1, 1, 4, 9], [1, 2, 4, 4], [], [0, 9, 9, 10]]
+    print("Shards:", shards)
+    print("\tMerged Unique Values:", list(merge_unique(*shards)))
+    print("-" * 55)
+
+    # Online container: inserts and sorted batches keep it deduplicated
+    unique = SortedUnique([1, 1, 2, 5], load=2)
+    unique.add(3)
+    unique.update([0, 2, 2, 9])
+    print("Online: [1, 1, 2, 5] + 3 + [0, 2, 2, 9]")
+    print("\tUnique Values:", list(unique))
+    print("\tFirst 3 (view):", list(unique[:3]))
+    print("-" * 55)
+
 # Run tests
 if __name__ == "__main__":
     main()
@@ -15,13 +15,52 @@ Approach:
 
 Time Complexity: O(n) – Iterate through the array exactly once using the while loop
 Space Complexity: O(n) – Create a 'result' array of size n to store the output
+
+Generalization (sorted_transform):
+- Squaring is just one function that decreases, then increases around a
+  known point (the pivot). abs(x), x*x + c and abs(x - p) behave the same way
+- The same two-pointer merge works for any such function
+- NumPy backend: find the pivot with searchsorted, apply the function to
+  both halves at once, reverse the left half and merge the two sorted
+  halves (a stable sort of two ascending runs is a single linear merge,
+  not a full re-sort)
 """
 
 
 
-from typing import List
+import sys
+from typing import Callable, List, Optional
+
+# NumPy is optional and only used for NumPy input, so list input never
+# pays for loading it
+np = None
+_numpy_missing = False
+
+
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def _is_ndarray(obj) -> bool:
+    """
+    isinstance(obj, np.ndarray) without importing NumPy: an array can only
+    exist once NumPy has been loaded.
+    """
+    return sys.modules.get("numpy") is not None and isinstance(obj, _numpy().ndarray)
+
 
-def sorted_squares(nums: List[int]) -> int:
+def sorted_squares(nums: List[int]) -> List[int]:
     """
     Return a sorted array of the squares of the elements in nums.
     
@@ -33,7 +72,12 @@ def sorted_squares(nums: List[int]) -> int:
 
     Returns:
         List of squares in sorted (non-decreasing) order
+        (a NumPy array when nums is a NumPy array)
     """
+    # NumPy input: use the vectorized backend
+    if _is_ndarray(nums):
+        return sorted_transform(nums)
+
     # Get the length of input array
     n = len(nums)
     # Create a result array filled with zeros, same size as input
@@ -72,6 +116,84 @@ def sorted_squares(nums: List[int]) -> int:
     return result
 
 
+def sorted_transform(nums, func: Optional[Callable] = None, pivot=0):
+    """
+    Return func applied to every element of nums, in non-decreasing order.
+
+    func must be non-increasing for x < pivot and non-decreasing for
+    x >= pivot (e.g. x * x, abs(x), x * x + c with pivot 0, or
+    abs(x - p) with pivot p), which is what lets a sorted input be merged
+    from both ends instead of re-sorted.
+
+    Args:
+        nums: Sorted list or 1-D NumPy array (non-decreasing order)
+        func: Valley-shaped function; squares when None. For NumPy input it
+            is called once per half and must accept arrays (ufunc-style)
+        pivot: Point where func turns from decreasing to increasing. Only the
+            NumPy backend needs it; the two-pointer merge finds it implicitly
+
+    Returns:
+        List of transformed values in sorted order
+        (a NumPy array when nums is a NumPy array)
+    """
+    if _is_ndarray(nums):
+        return _sorted_transform_numpy(nums, func or np.square, pivot)
+
+    if func is None:
+        func = _square
+
+    # Same two-pointer merge as sorted_squares: the largest values sit at
+    # the two ends, so fill the result from the back
+    n = len(nums)
+    result = [None] * n
+    left, right, pos = 0, n - 1, n - 1
+    while left <= right:
+        left_value = func(nums[left])
+        right_value = func(nums[right])
+        if left_value > right_value:
+            result[pos] = left_value
+            left += 1
+        else:
+            result[pos] = right_value
+            right -= 1
+        pos -= 1
+    return result
+
+
+def _square(x):
+    """Default transform of sorted_transform."""
+    return x * x
+
+
+def _sorted_transform_numpy(nums: "np.ndarray", func: Callable, pivot) -> "np.ndarray":
+    """
+    Vectorized sorted_transform for a sorted 1-D NumPy array.
+
+    Args:
+        nums (np.ndarray): Sorted input
+        func: Vectorized valley-shaped function
+        pivot: Point where func turns from decreasing to increasing
+
+    Returns:
+        np.ndarray: Transformed values in sorted order
+    """
+    # Everything before split is left of the pivot (func decreasing there)
+    split = int(np.searchsorted(nums, pivot, side="left"))
+
+    # Transform both halves at once; reversing the left half makes both
+    # halves non-decreasing
+    low = np.asarray(func(nums[:split]))[::-1]
+    high = np.asarray(func(nums[split:]))
+
+    # Merge the two sorted halves. NumPy's stable sort (timsort for most
+    # dtypes) detects the two ascending runs and joins them with one
+    # linear merge
+    result = np.concatenate((low, high))
+    if low.size and high.size:
+        result.sort(kind="stable")
+    return result
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -95,3 +217,10 @@ if __name__ == "__main__":
     print(f"Input: {nums4}")
     print(f"Output: {sorted_squares(nums4)}")
     print()
+    print("-" * 50)
+
+    # Test case 5: Sorted by distance to a pivot
+    nums5 = [-3.5, -1.0, 0.5, 2.0, 4.0, 7.5]
+    print(f"Input: {nums5}")
+    print(f"Output: {sorted_transform(nums5, lambda x: abs(x - 2.5), pivot=2.5)}")
+    print()
@@ -18,90 +18,923 @@ Time Complexity: O(n²) - Sorting the array takes O(n log n)
 
 Space Complexity: O(1) - the algorithm’s space complexity is constant O(1)
 # Apart from the space used by the built-in sorting algorithm
+
+Lazy and bounded output (iter_three_sum / count_three_sum / limit=):
+- iter_three_sum runs the same scan as a generator, yielding each triplet
+  as a tuple the moment it is found, so nothing is collected
+- count_three_sum only counts the triplets
+- three_sum(..., limit=m) stops the scan once m triplets are found
+  (three_sum_counts and three_sum_numpy accept the same option)
+Space Complexity: O(1) - beyond the sorted array (O(limit) for the list)
+
+Duplicate-aware variant (three_sum_counts):
+- Reduce the input to (distinct value, multiplicity) pairs with a Counter
+- Run the same two-pointer scan over the sorted distinct values only, letting
+  the pointers meet (low == i, high == low) when a value occurs often enough
+  to be used two or three times ([x, x, y] and [0, 0, 0])
+Time Complexity: O(n + d²) - where d is the number of distinct values
+Space Complexity: O(d) - for the value counts
+
+Parallel variant (three_sum_parallel):
+- Once the array is sorted, every iteration of the outer i loop is
+  independent, so the i range is split across a process pool
+- Each worker receives the sorted list once, through the pool initializer,
+  instead of a copy per task. It is a private copy on purpose: the inner
+  loop indexes a list about 1.5x faster than a shared 64-bit buffer, whose
+  every read creates a new int, so shared memory would save the copy but
+  not the time
+- Chunk boundaries are chosen so every chunk has about the same inner-scan
+  work (iteration i costs about n - i steps), not the same number of i values
+- Results are concatenated in chunk order, which is exactly the serial order
+Time Complexity: O(n² / p) - with p worker processes
+Space Complexity: O(n) - per worker, for its copy of the sorted list
+
+Vectorized variant (three_sum_numpy):
+- Keep the outer loop, but over the distinct values only
+- Replace the inner low/high walk with one array operation: for every
+  candidate second value b, look up c = target - a - b in the sorted
+  distinct values with np.searchsorted, and use the value counts to allow
+  [x, x, y] and [x, x, x]
+- Candidates come out in increasing b, which is the order the two-pointer
+  walk finds them in, so the output matches three_sum exactly
+Time Complexity: O(n log n + d² log d) - with no per-pair Python work
+
+Incremental index (ThreeSumIndex):
+- Keep the multiset as value counts plus the sorted distinct values, and
+  the current unique triplets as a set, indexed by each value they contain
+- insert(x): only triplets containing x can appear, i.e. pairs y + z with
+  y + z == target - x; one two-pointer walk over the distinct values finds
+  them all
+- delete(x): only triplets containing x can disappear; re-check just those
+  against the new counts
+- query() sorts the triplets into three_sum order; results are kept in a
+  small LRU cache keyed by an additive multiset fingerprint, so returning to
+  an earlier snapshot (or asking twice) skips the sort; a hit is checked
+  against the current triplets in O(t), so a collision cannot return the
+  answer of another multiset
+Time Complexity: O(d) per insert/delete (plus O(d) to keep the sorted
+values), O(t log t) per uncached query and O(t) per cached one - t
+triplets, d distinct values
+Space Complexity: O(d + t) - plus the cached results
+
+k-sum engine (k_sum / k_sum_closest):
+- Sort once (in place, or a copy with copy=True) and build prefix sums, so
+  the sum of any slice is one subtraction
+- Fix the smallest element and recurse on the suffix with k - 1 and the
+  remaining target, down to the two-pointer walk of three_sum for k == 2
+- Prune with the suffix bounds: the k smallest candidates (from i on) give
+  the minimum sum, so once it exceeds the target no later i can match; the
+  k - 1 largest values give the maximum, so a too-small one skips this i
+- Skip duplicate values at every level, as three_sum does for the first
+- k_sum_closest walks the same tree but only keeps the best combination,
+  stopping as soon as an exact match is found
+Time Complexity: O(n^(k-1)) - for k >= 2, plus O(n log n) to sort
+Space Complexity: O(n + k) - the prefix sums (and the copy) plus recursion
 """
 
 
-from typing import List
+import os
+import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# NumPy is optional and only imported by three_sum_numpy, so the other
+# variants never pay for loading it
+np = None
+_numpy_missing = False
 
 
-def three_sum(nums: List[int]) -> List[List[int]]:
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
     """
-    Find all unique triplets in the array that sum to zero.
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def _is_ndarray(obj) -> bool:
+    """
+    isinstance(obj, np.ndarray) without importing NumPy: an array can only
+    exist once NumPy has been loaded.
+    """
+    return sys.modules.get("numpy") is not None and isinstance(obj, _numpy().ndarray)
+
+
+# three_sum_numpy works in int64; values and target up to this magnitude
+# keep every sum it forms (at most three of them) inside that range
+_INT64_SUM_BOUND = 1 << 61
+
+# Below this many elements the pool start-up costs more than it saves
+PARALLEL_MIN_SIZE = 2000
+
+# Chunks per worker; more chunks smooth out uneven chunk run times
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+# Query results ThreeSumIndex keeps by default
+INDEX_CACHE_SIZE = 32
+
+# Fingerprints are sums of per-value hashes modulo 2**64
+_MASK64 = (1 << 64) - 1
+
+# 2**64 / golden ratio, the splitmix64 increment
+_GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def three_sum(nums: List[int], target: int = 0,
+              limit: Optional[int] = None) -> List[List[int]]:
+    """
+    Find all unique triplets in the array that sum to target (zero by default).
     
     The function uses a two-pointer approach after sorting to efficiently
     find all combinations without duplicates.
 
     Args:
-        nums: List of integers
+        nums: List of integers (an integer NumPy array is sorted in place
+            the same way and searched by three_sum_numpy)
+        target: Value every triplet must sum to
+        limit: Stop after this many triplets (default: find all)
         
     Returns:
-        List of lists containing all unique triplets that sum to zero
+        List of lists containing all unique triplets that sum to target
+        (the first `limit` of them, in the usual order, when limit is set)
     """
-    # Initialize result array to store all valid triplets
-    result = []
-
-    # Get the length of the input array
-    n = len(nums)
-
     # Step-1: Sort the input array in ascending order
     # This enables the two-pointer technique and helps skip duplicates
     nums.sort()
 
+    # Integer NumPy input: the vectorized engine finds the same triplets
+    if _is_ndarray(nums) and np.issubdtype(nums.dtype, np.integer):
+        return three_sum_numpy(nums, target, limit)
+
+    # Nothing to find when the caller wants no triplets
+    if limit is not None and limit <= 0:
+        return []
+
+    # Step-2..6: Run the scan (_iter_sorted_three_sum), stopping once the
+    # caller has enough triplets
+    return list(map(list, islice(_iter_sorted_three_sum(nums, target), limit)))
+
+
+def three_sum_counts(nums: List[int], target: int = 0,
+                     limit: Optional[int] = None) -> List[List[int]]:
+    """
+    Find all unique triplets that sum to target, working on distinct values.
+
+    Meant for highly repetitive inputs: the cost depends on the number of
+    distinct values instead of len(nums). The result is identical to
+    three_sum (same triplets, same order) and nums is not modified.
+
+    Args:
+        nums: List of integers
+        target: Value every triplet must sum to
+        limit: Stop after this many triplets (default: find all)
+
+    Returns:
+        List of lists containing all unique triplets that sum to target
+    """
+    result = []
+    if limit is not None and limit <= 0:
+        return result
+
+    # Step-1: Reduce the input to distinct values and their multiplicities
+    counts = Counter(nums)
+    values = sorted(counts)
+    d = len(values)
+
+    # Step-2: The first element of the triplet is values[i]
+    for i in range(d):
+        first = values[i]
+
+        # Same early exit as three_sum: the other two are at least as large
+        if 3 * first > target:
+            break
+
+        # Step-3: Two pointers over the distinct values, starting at i
+        # itself so the same value can be picked more than once
+        low = i
+        high = d - 1
+
+        while low <= high:
+            current_sum = first + values[low] + values[high]
+
+            if current_sum < target:
+                low += 1
+            elif current_sum > target:
+                high -= 1
+            else:
+                # Step-4: Check there are enough copies of repeated values
+                if low == high:
+                    # [x, y, y] needs y twice, [x, x, x] needs x three times
+                    enough = counts[values[low]] >= (3 if i == low else 2)
+                elif i == low:
+                    # [x, x, y] needs x twice
+                    enough = counts[first] >= 2
+                else:
+                    enough = True
+
+                if enough:
+                    result.append([first, values[low], values[high]])
+                    if limit is not None and len(result) >= limit:
+                        return result
+
+                # Distinct values never repeat, so no duplicate skipping
+                low += 1
+                high -= 1
+
+    return result
+
+
+def _iter_pairs(nums: List[int], first: int, target: int,
+                low: int) -> Iterator[Tuple[int, int]]:
+    """
+    The two-pointer walk of three_sum: yield every unique pair (b, c) of
+    the sorted nums[low:] with first + b + c == target, b from the left.
+    """
+    # High pointer starts at the end of array (index n - 1)
+    high = len(nums) - 1
+
+    while low < high:
+        # Calculate the sum of current triplet
+        current_sum = first + nums[low] + nums[high]
+
+        # Step-5a: If sum is less than target, move low pointer forward
+        # This increases the sum since array is sorted
+        if current_sum < target:
+            low += 1
+
+        # Step-5b: If sum is greater than target, move high pointer backward
+        # This decreases the sum since array is sorted
+        elif current_sum > target:
+            high -= 1
+
+        # Step-6: Sum equals target, we found a valid pair
+        else:
+            # Hand the pair out right away instead of collecting it
+            yield nums[low], nums[high]
+
+            # Move low pointer forward and skip duplicates
+            low += 1
+            while low < high and nums[low] == nums[low - 1]:
+                low += 1
+
+            # Move high pointer backward and skip duplicates
+            high -= 1
+            while low < high and nums[high] == nums[high + 1]:
+                high -= 1
+
+
+def _iter_sorted_three_sum(nums: List[int], target: int, start: int = 0,
+                           stop: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+    """
+    The three_sum scan over an already sorted list, as a generator.
+
+    start / stop restrict the first element's index i to start <= i < stop
+    (three_sum_parallel gives every worker one such range).
+    """
+    n = len(nums)
+
     # Step-2: Iterate over the array
     # We only need to iterate until n - 2 because we need at least 3 elements
-    for i in range(n - 2):
-        # Optimization: If current number is greater than 0, break
-        # Since array is sorted, all remaining numbers are positive
-        # No triplet can sum to zero with all positive numbers
-        if nums[i] > 0:
-            break
+    for i in range(start, n - 2 if stop is None else min(stop, n - 2)):
+        first = nums[i]
 
+        # Optimization: No triplet can sum to target once its smallest
+        # element is too big, since the other two are at least as large
+        # (for target = 0 this is simply nums[i] > 0)
+        if 3 * first > target:
+            break
 
         # Step-3: Skip duplicate values for the first element
-        # This prevents duplicate triplets in the result
-        if i > 0 and nums[i] == nums[i - 1]:
+        # This prevents duplicate triplets in the result; indices are
+        # global, so this also works for the first i of a worker's range
+        if i > 0 and first == nums[i - 1]:
             continue
 
-        # Step-4: Use two pointers to find triplets
-        # Low pointer starts right after current element (index i + 1)
-        low = i + 1
-        # High pointer starts at the end of array (index n - 1)
-        high = n - 1
+        # Step-4: Two pointers over the rest of the array, starting right
+        # after the current element
+        for second, third in _iter_pairs(nums, first, target, i + 1):
+            yield first, second, third
 
-        # Two-pointer approach to find pairs that sum to -nums[i]
-        while low < high:
-            # Calculate the sum of current triplet
-            current_sum = nums[i] + nums[low] + nums[high]
 
-            # Step-5a: If sum is less than 0, move low pointer forward
-            # This increases the sum since array is sorted
-            if current_sum < 0:
-                low += 1
+def iter_three_sum(nums: List[int], target: int = 0) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield the unique triplets of three_sum one at a time, as tuples.
 
-            # Step-5b: If sum is greater than 0, move high pointer backward
-            # This decreases the sum since array is sorted
-            elif current_sum > 0:
-                high -= 1
+    nums is sorted in place right away (as three_sum does); the scan itself
+    runs as the iterator is consumed, so taking the first few triplets
+    (e.g. with itertools.islice) does only the work needed for them.
 
-            # Step-6: Sum equals 0, we found a valid triplet
-            else:
-                # Add the triplet to result array
-                result.append([nums[i], nums[low], nums[high]])
+    Args:
+        nums: List of integers
+        target: Value every triplet must sum to
+
+    Returns:
+        Iterator over (a, b, c) tuples, in three_sum order
+    """
+    nums.sort()
+    return _iter_sorted_three_sum(nums, target)
+
+
+def count_three_sum(nums: List[int], target: int = 0) -> int:
+    """
+    Count the unique triplets of three_sum without storing them.
+
+    Args:
+        nums: List of integers (sorted in place)
+        target: Value every triplet must sum to
+
+    Returns:
+        int: len(three_sum(nums, target)), in O(1) extra memory
+    """
+    return sum(1 for _ in iter_three_sum(nums, target))
+
+
+# ────────────────────────────────────────────────
+# Parallel Variant
+# ────────────────────────────────────────────────
+# Sorted array of the current pool, set once per worker process
+_worker_nums: List[int] = []
+
+
+def _set_worker_nums(nums: List[int]) -> None:
+    """
+    Pool initializer: keep the sorted array for every task of this worker.
+    """
+    global _worker_nums
+    _worker_nums = nums
+
+
+def _three_sum_range(task: Tuple[int, int, int]) -> List[List[int]]:
+    """
+    Run the outer loop of three_sum for start <= i < stop only.
+
+    Args:
+        task: (start, stop, target)
+
+    Returns:
+        Triplets whose first element is nums[i] for i in the range
+    """
+    start, stop, target = task
+    return [list(triplet)
+            for triplet in _iter_sorted_three_sum(_worker_nums, target, start, stop)]
+
+
+def _balanced_chunks(n: int, stop: int, chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split range(stop) into ranges of about equal inner-scan work.
+
+    Iteration i of the outer loop scans about n - i elements, so early
+    chunks get fewer i values than late ones.
+
+    Args:
+        n: Length of the sorted array
+        stop: End of the outer loop range
+        chunks: Number of ranges wanted
+
+    Returns:
+        List of (start, stop) pairs covering range(stop), in order
+    """
+    total = sum(n - i for i in range(stop))
+    share = total / chunks
+
+    ranges = []
+    start = 0
+    work = 0
+    for i in range(stop):
+        work += n - i
+        if work >= share * (len(ranges) + 1) and len(ranges) < chunks - 1:
+            ranges.append((start, i + 1))
+            start = i + 1
+    if start < stop:
+        ranges.append((start, stop))
+    return ranges
+
+
+def three_sum_parallel(nums: List[int], target: int = 0,
+                       workers: Optional[int] = None) -> List[List[int]]:
+    """
+    Find all unique triplets that sum to target, using several processes.
+
+    Same result and order as three_sum, and, like three_sum, nums is sorted
+    in-place. Small inputs are handled by three_sum directly.
+
+    Args:
+        nums: List of integers
+        target: Value every triplet must sum to
+        workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        List of lists containing all unique triplets that sum to target
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(nums)
+    if workers == 1 or n < PARALLEL_MIN_SIZE:
+        return three_sum(nums, target)
+
+    # Step-1: Sort once
+    nums.sort()
+
+    # Step-2: Only i values with 3 * nums[i] <= target can start a triplet
+    # (the same early exit as three_sum); target // 3 is exact for
+    # integers, and the walk covers values in between, e.g. floats
+    stop = bisect_right(nums, target // 3)
+    while stop < n and 3 * nums[stop] <= target:
+        stop += 1
+    stop = min(stop, n - 2)
+    if stop <= 0:
+        return []
+
+    # Step-3: Hand every worker the sorted array once, then scan balanced
+    # chunks of the i range
+    chunks = _balanced_chunks(n, stop, workers * PARALLEL_CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_set_worker_nums,
+                             initargs=(nums,)) as pool:
+        parts = pool.map(_three_sum_range,
+                         [(start, end, target) for start, end in chunks])
+
+        # Step-4: Chunks come back in order, so concatenating them
+        # reproduces the serial order
+        result = []
+        for part in parts:
+            result.extend(part)
+
+    return result
+
+
+# ────────────────────────────────────────────────
+# Vectorized Variant
+# ────────────────────────────────────────────────
+def _fits_int64(array: "np.ndarray", target) -> bool:
+    """
+    True when three_sum_numpy can search array exactly in int64: integer
+    values and target, all small enough that no partial sum overflows.
+    """
+    if array.dtype.kind not in "iu" or array.ndim != 1:
+        return False
+    if not isinstance(target, (int, np.integer)) or isinstance(target, bool):
+        return False
+    if abs(int(target)) > _INT64_SUM_BOUND:
+        return False
+    return array.size == 0 or (int(array.min()) >= -_INT64_SUM_BOUND
+                               and int(array.max()) <= _INT64_SUM_BOUND)
 
-                # Move low pointer forward and skip duplicates
-                low += 1
-                while low < high and nums[low] == nums[low - 1]:
-                    low += 1
 
-                # Move high pointer backward and skip duplicates
+def three_sum_numpy(nums: List[int], target: int = 0,
+                    limit: Optional[int] = None) -> List[List[int]]:
+    """
+    Find all unique triplets that sum to target with NumPy array operations.
+
+    Same triplets, in the same order, as three_sum, but nums is not
+    modified. Only integers whose sums fit in 64 bits are searched with
+    NumPy; floats, wider integers and other values (which int64 would
+    truncate or wrap), and any input when NumPy is missing, go to
+    three_sum_counts, which has the same contract.
+
+    Args:
+        nums: List (or NumPy array) of integers
+        target: Value every triplet must sum to
+        limit: Stop after this many triplets (default: find all)
+
+    Returns:
+        List of lists containing all unique triplets that sum to target
+    """
+    if _numpy() is None:
+        return three_sum_counts(list(nums), target, limit)
+    if limit is not None and limit <= 0:
+        return []
+
+    try:
+        array = np.asarray(nums)
+    except (OverflowError, ValueError):
+        array = None
+    if array is None or not _fits_int64(array, target):
+        # The caller's own values: asarray() may have made floats of wide
+        # ints, and tolist() turns NumPy scalars into exact Python numbers
+        values = nums.tolist() if _is_ndarray(nums) else list(nums)
+        return three_sum_counts(values, target, limit)
+
+    # Step-1: Sorted distinct values and how often each occurs
+    values, counts = np.unique(array.astype(np.int64), return_counts=True)
+
+    # Step-2: Outer loop over distinct first values a with 3 * a <= target
+    # (the same early exit as three_sum)
+    stop = int(np.searchsorted(values, target // 3, side="right"))
+    firsts, seconds = [], []
+    found_so_far = 0
+
+    for i in range(stop):
+        first = int(values[i])
+        rest = target - first
+
+        # Candidates for the second value b: values[i:], with b <= c means
+        # b <= rest // 2
+        end = int(np.searchsorted(values, rest // 2, side="right"))
+        if end <= i:
+            continue
+        b = values[i:end]
+
+        # Copies of each candidate still available once a is used
+        available = counts[i:end].copy()
+        available[0] -= 1
+
+        # Step-3: Look every c = rest - b up at once instead of walking
+        # the low/high pointers toward each other
+        c = rest - b
+        pos = np.minimum(np.searchsorted(values, c), values.size - 1)
+        found = (values[pos] == c) & (available > 0)
+
+        # b == c needs two available copies ([x, y, y] / [x, x, x])
+        found &= (c != b) | (available >= 2)
+
+        hits = b[found]
+        if limit is not None:
+            hits = hits[:limit - found_so_far]
+        if hits.size:
+            firsts.append(np.full(hits.size, first, dtype=np.int64))
+            seconds.append(hits)
+            found_so_far += hits.size
+
+        # Skip the remaining first values once there are enough triplets
+        if limit is not None and found_so_far >= limit:
+            break
+
+    if not firsts:
+        return []
+
+    # Step-4: Build every triplet with one column_stack
+    a = np.concatenate(firsts)
+    b = np.concatenate(seconds)
+    return np.column_stack((a, b, target - a - b)).tolist()
+
+
+# ────────────────────────────────────────────────
+# Incremental Index
+# ────────────────────────────────────────────────
+def _mix64(h: int) -> int:
+    """
+    splitmix64 finalizer: spreads every input bit over the 64-bit result.
+    """
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+
+def _value_hash(value: int) -> int:
+    """
+    Well-mixed 64-bit hash of one value, so sums of hashes of different
+    multisets rarely collide.
+    """
+    # hash(-1) == hash(-2) and hash(v) == hash(v + 2**61 - 1) in CPython, so
+    # integers fold in every 64-bit limb of their own bits, then the sign
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)      # 2.0 and 2 are the same multiset element
+    if not isinstance(value, int):
+        return _mix64(hash(value) & _MASK64)
+    # Adding the golden-ratio constant each step keeps zero limbs (and the
+    # number of limbs) visible, since _mix64(0) == 0
+    h = 0
+    while True:
+        h = _mix64(((h ^ (value & _MASK64)) + _GOLDEN64) & _MASK64)
+        value >>= 64
+        if value in (0, -1):
+            return _mix64(((h ^ (value & 1)) + _GOLDEN64) & _MASK64)
+
+
+class ThreeSumIndex:
+    """
+    Unique triplets summing to target of a multiset that changes over time.
+
+    Example:
+        index = ThreeSumIndex([-1, 0, 1, 2, -1, -4])
+        index.query()      # [[-1, -1, 2], [-1, 0, 1]]
+        index.insert(-2)
+        index.query()      # [[-2, 0, 2], [-1, -1, 2], [-1, 0, 1]]
+        index.delete(-1)
+        index.query()      # [[-2, 0, 2], [-1, 0, 1]]
+
+    query() returns the same triplets in the same order as three_sum on the
+    current contents.
+    """
+
+    def __init__(self, nums: Iterable[int] = (), target: int = 0,
+                 cache_size: int = INDEX_CACHE_SIZE) -> None:
+        """
+        Args:
+            nums: Initial contents
+            target: Value every triplet must sum to
+            cache_size: Number of query results kept (0 disables caching)
+        """
+        self._target = target
+        self.cache_size = cache_size
+
+        # Multiset: value -> multiplicity, plus the distinct values sorted
+        self._counts = Counter(nums)
+        self._values = sorted(self._counts)
+        self._size = sum(self._counts.values())
+
+        # Additive fingerprint: changes by one hash per insert/delete
+        self._fingerprint = 0
+        for value, count in self._counts.items():
+            self._fingerprint = (self._fingerprint + count * _value_hash(value)) & _MASK64
+
+        # Current triplets (sorted tuples) and, per value, the triplets using it
+        self._triplets: Set[Tuple[int, int, int]] = set()
+        self._by_value: Dict[int, Set[Tuple[int, int, int]]] = {}
+        for triplet in three_sum_counts(list(self._counts.elements()), target):
+            self._add_triplet(tuple(triplet))
+
+        # fingerprint -> query result, least recently used first
+        self._cache: "OrderedDict[Tuple[int, int], Tuple[Tuple[int, int, int], ...]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._counts
+
+    @property
+    def target(self) -> int:
+        """
+        Value every triplet sums to (fixed; cached results depend on it).
+        """
+        return self._target
+
+    @property
+    def fingerprint(self) -> Tuple[int, int]:
+        """
+        (size, sum of value hashes): equal for equal multisets, whatever
+        order of inserts and deletes led to them.
+        """
+        return self._size, self._fingerprint
+
+    def _add_triplet(self, triplet: Tuple[int, int, int]) -> None:
+        self._triplets.add(triplet)
+        for value in set(triplet):
+            self._by_value.setdefault(value, set()).add(triplet)
+
+    def _discard_triplet(self, triplet: Tuple[int, int, int]) -> None:
+        self._triplets.discard(triplet)
+        for value in set(triplet):
+            users = self._by_value[value]
+            users.discard(triplet)
+            if not users:
+                del self._by_value[value]
+
+    def _available(self, triplet: Tuple[int, int, int]) -> bool:
+        """
+        True when the multiset holds enough copies of every value used.
+        """
+        return all(self._counts[value] >= need for value, need in Counter(triplet).items())
+
+    def insert(self, value: int) -> None:
+        """
+        Add one copy of value and every triplet it completes. O(d).
+        """
+        if value not in self._counts:
+            insort(self._values, value)
+        self._counts[value] += 1
+        self._size += 1
+        self._fingerprint = (self._fingerprint + _value_hash(value)) & _MASK64
+
+        # New triplets must use the new copy: find every pair y <= z of
+        # distinct values with y + z == target - value by two pointers
+        rest = self._target - value
+        values = self._values
+        low = 0
+        high = len(values) - 1
+        while low <= high:
+            pair_sum = values[low] + values[high]
+            if pair_sum < rest:
+                low += 1
+            elif pair_sum > rest:
                 high -= 1
-                while low < high and nums[high] == nums[high + 1]:
-                    high -= 1
+            else:
+                triplet = tuple(sorted((value, values[low], values[high])))
+                if triplet not in self._triplets and self._available(triplet):
+                    self._add_triplet(triplet)
+                low += 1
+                high -= 1
+
+    def delete(self, value: int) -> None:
+        """
+        Remove one copy of value and every triplet that no longer has
+        enough copies. O(d). Raises ValueError if value is not present.
+        """
+        if value not in self._counts:
+            raise ValueError(f"{value!r} is not in the index")
+
+        self._counts[value] -= 1
+        if self._counts[value] == 0:
+            del self._counts[value]
+            del self._values[bisect_left(self._values, value)]
+        self._size -= 1
+        self._fingerprint = (self._fingerprint - _value_hash(value)) & _MASK64
+
+        # Only triplets using value can lose an element
+        for triplet in list(self._by_value.get(value, ())):
+            if not self._available(triplet):
+                self._discard_triplet(triplet)
+
+    def query(self) -> List[List[int]]:
+        """
+        Current unique triplets, in three_sum order.
+        """
+        key = self.fingerprint
+        result = self._cache.get(key)
+
+        # A hit must hold exactly the current triplets: another multiset
+        # with the same fingerprint then costs a re-sort, not a wrong answer
+        if result is not None and (len(result) != len(self._triplets)
+                                   or not all(t in self._triplets for t in result)):
+            result = None
+
+        if result is None:
+            result = tuple(sorted(self._triplets))
+            if self.cache_size > 0:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+
+        return [list(triplet) for triplet in result]
+
+
+# ────────────────────────────────────────────────
+# k-Sum Engine
+# ────────────────────────────────────────────────
+def _sorted_with_prefix(nums: List[int], copy: bool) -> Tuple[List[int], List[int]]:
+    """
+    Sort nums (or a copy of it) and return it with its prefix sums.
+    """
+    if copy:
+        nums = sorted(nums)
+    else:
+        nums.sort()
+    return nums, list(accumulate(nums, initial=0))
+
+
+def _k_sum(nums: List[int], prefix: List[int], k: int, target: int,
+           start: int, chosen: List[int], result: List[List[int]]) -> None:
+    """
+    Append every unique k-combination of nums[start:] summing to target,
+    each prefixed with the values already chosen by the outer levels.
+    """
+    n = len(nums)
+
+    # Base case: the two-pointer walk of three_sum
+    if k == 2:
+        for second, third in _iter_pairs(nums, 0, target, start):
+            result.append(chosen + [second, third])
+        return
 
-    # Step-7: Return the result array containing all unique triplets
+    for i in range(start, n - k + 1):
+        # Skip duplicate values at this level
+        if i > start and nums[i] == nums[i - 1]:
+            continue
+
+        # Smallest sum with nums[i] first: every later i is even larger
+        if prefix[i + k] - prefix[i] > target:
+            break
+
+        # Largest sum with nums[i] first: this i cannot reach the target
+        if nums[i] + prefix[n] - prefix[n - k + 1] < target:
+            continue
+
+        _k_sum(nums, prefix, k - 1, target - nums[i], i + 1, chosen + [nums[i]], result)
+
+
+def k_sum(nums: List[int], k: int, target: int = 0, copy: bool = False) -> List[List[int]]:
+    """
+    Find all unique k-element combinations that sum to target.
+
+    k_sum(nums, 3) gives the same triplets in the same order as
+    three_sum(nums); k_sum(nums, 2, t) and k_sum(nums, 4, t) are 2-sum and
+    4-sum.
+
+    Args:
+        nums: List of integers
+        k: Number of elements per combination (at least 1)
+        target: Value every combination must sum to
+        copy: Sort a copy instead of sorting nums in place
+
+    Returns:
+        List of lists, each sorted, in lexicographic order
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    nums, prefix = _sorted_with_prefix(nums, copy)
+    if k == 1:
+        i = bisect_left(nums, target)
+        return [[target]] if i < len(nums) and nums[i] == target else []
+
+    result: List[List[int]] = []
+    if len(nums) >= k:
+        _k_sum(nums, prefix, k, target, 0, [], result)
     return result
 
 
+def _k_sum_closest(nums: List[int], prefix: List[int], k: int, target: int,
+                   start: int, chosen: List[int], best: list) -> bool:
+    """
+    Update best = [distance, combination] with the k-combinations of
+    nums[start:] closest to target. Returns True on an exact match.
+    """
+    n = len(nums)
+
+    def consider(candidate: List[int], candidate_sum: int) -> None:
+        distance = abs(candidate_sum - target)
+        if best[0] is None or distance < best[0]:
+            best[0], best[1] = distance, chosen + candidate
+
+    if k == 1:
+        # The values around the insertion point of target are the closest
+        i = bisect_left(nums, target, start)
+        for j in (i - 1, i):
+            if start <= j < n:
+                consider([nums[j]], nums[j])
+        return best[0] == 0
+
+    if k == 2:
+        low = start
+        high = n - 1
+        while low < high:
+            current_sum = nums[low] + nums[high]
+            consider([nums[low], nums[high]], current_sum)
+            if current_sum < target:
+                low += 1
+            elif current_sum > target:
+                high -= 1
+            else:
+                return True
+        return False
+
+    for i in range(start, n - k + 1):
+        if i > start and nums[i] == nums[i - 1]:
+            continue
+
+        # Every sum from here on is at least this one: it is the best left
+        low_sum = prefix[i + k] - prefix[i]
+        if low_sum >= target:
+            consider(nums[i:i + k], low_sum)
+            break
+
+        # Every sum with nums[i] first is at most this one
+        high_sum = nums[i] + prefix[n] - prefix[n - k + 1]
+        if high_sum <= target:
+            consider([nums[i]] + nums[n - k + 1:], high_sum)
+            if high_sum == target:
+                return True
+            continue
+
+        if _k_sum_closest(nums, prefix, k - 1, target - nums[i], i + 1,
+                          chosen + [nums[i]], best):
+            return True
+
+    return best[0] == 0
+
+
+def k_sum_closest(nums: List[int], k: int, target: int = 0,
+                  copy: bool = False) -> Optional[List[int]]:
+    """
+    Find one k-element combination whose sum is closest to target.
+
+    Only the best combination is kept, and the search stops at the first
+    exact match.
+
+    Args:
+        nums: List of integers
+        k: Number of elements (at least 1)
+        target: Value the sum should be close to
+        copy: Sort a copy instead of sorting nums in place
+
+    Returns:
+        The combination (sorted), or None when nums has fewer than k values
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    nums, prefix = _sorted_with_prefix(nums, copy)
+    if len(nums) < k:
+        return None
+
+    best = [None, None]     # [distance to target, combination]
+    _k_sum_closest(nums, prefix, k, target, 0, [], best)
+    return best[1]
+
+
 # ────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -144,3 +977,63 @@ if __name__ == "__main__":
     print(f"Output: {three_sum(nums5)}")
     print(f"Expected: []")
     print()
+    print("-" * 50)
+
+    # Test case-6: Many repeated readings, non-zero target, distinct-value mode
+    nums6 = [1, 1, 1, 2, 2, 3, 3, 3, 3] * 1000
+    print(f"Input: [1, 1, 1, 2, 2, 3, 3, 3, 3] * 1000, target = 6")
+    print(f"Output: {three_sum_counts(nums6, target=6)}")
+    print(f"Expected: [[1, 2, 3], [2, 2, 2]]")
+    print()
+    print("-" * 50)
+
+    # Test case-7: Parallel scan gives the same triplets in the same order
+    nums7 = [(i * 7919) % 4001 - 2000 for i in range(3000)]
+    print(f"Input: 3000 integers in [-2000, 2000]")
+    print(f"Output matches three_sum: "
+          f"{three_sum_parallel(nums7.copy(), workers=2) == three_sum(nums7.copy())}")
+    print(f"Expected: True")
+    print()
+    print("-" * 50)
+
+    # Test case-8: Vectorized inner search
+    nums8 = [-1, 0, 1, 2, -1, -4]
+    print(f"Input: {nums8}")
+    print(f"Output: {three_sum_numpy(nums8)}")
+    print(f"Expected: [[-1, -1, 2], [-1, 0, 1]]")
+    print()
+    print("-" * 50)
+
+    # Test case-9: Incremental index, updated instead of recomputed
+    index = ThreeSumIndex([-1, 0, 1, 2, -1, -4])
+    index.insert(-2)
+    index.delete(-1)
+    print(f"Input: [-1, 0, 1, 2, -1, -4], insert -2, delete -1")
+    print(f"Output: {index.query()}")
+    print(f"Expected: [[-2, 0, 2], [-1, 0, 1]]")
+    print()
+    print("-" * 50)
+
+    # Test case-10: 4-sum on a sorted copy (input left unmodified)
+    nums10 = [1, 0, -1, 0, -2, 2]
+    print(f"Input: {nums10}, k = 4")
+    print(f"Output: {k_sum(nums10, 4, copy=True)}, input after: {nums10}")
+    print(f"Expected: [[-2, -1, 1, 2], [-2, 0, 0, 2], [-1, 0, 0, 1]], input after: {nums10}")
+    print()
+    print("-" * 50)
+
+    # Test case-11: Closest 3-sum
+    nums11 = [-1, 2, 1, -4]
+    print(f"Input: {nums11}, k = 3, target = 1")
+    print(f"Output: {k_sum_closest(nums11, 3, target=1, copy=True)}")
+    print(f"Expected: [-1, 1, 2]")
+    print()
+    print("-" * 50)
+
+    # Test case-12: Lazy output, a count, and an early stop
+    nums12 = [-1, 0, 1, 2, -1, -4]
+    print(f"Input: {nums12}")
+    print(f"Output: {list(iter_three_sum(nums12.copy()))}, "
+          f"count={count_three_sum(nums12.copy())}, limit=1 -> {three_sum(nums12.copy(), limit=1)}")
+    print(f"Expected: [(-1, -1, 2), (-1, 0, 1)], count=2, limit=1 -> [[-1, -1, 2]]")
+    print()
@@ -17,10 +17,80 @@ Time Complexity: O(n) - Single pass through the array
 
 Space Complexity: O(1) - In-place sorting with constant extra space
 # Only using three pointer variables
+
+Generalization to k colors (sort_colors_k):
+- Typed buffers (bytearray, array.array, NumPy arrays) hold plain integer
+  codes, so count each color (np.bincount, or bytes.count without NumPy)
+  and rewrite the buffer with one bulk slice fill per color
+- Anything else (e.g. a list) uses repeated Dutch National Flag passes:
+  each pass moves the smallest remaining color to the front and the largest
+  to the back, then shrinks the window, so k colors need about k / 2 passes
+Time Complexity: O(n) for buffers with small k; O(n * k) for the DNF passes
+Space Complexity: O(k) - one counter per color
+
+Stable partition of records by a small key (partition_by_key):
+- Call the key function once per record and store the keys in a compact
+  array (one byte per record for up to 256 buckets)
+- Counting pass: how many records fall in each bucket
+- Prefix sums of the counts give the first output slot of every bucket;
+  each record is written to its bucket's next slot of a preallocated
+  output, so records keep their original order inside a bucket
+- With NumPy and up to 65536 buckets the counting and placement run as
+  array operations (NumPy's stable sort of 8/16-bit keys is a radix sort,
+  i.e. the same counting placement), and the records are gathered in one
+  step; more buckets use the counting pass above
+- in_place=True copies the finished output back into records: a stable
+  placement needs every record's destination, so it saves no memory
+Time Complexity: O(n + buckets) - no comparisons between records or keys
+Space Complexity: O(n) - the output list plus one compact key per record
 """
 
 
-from typing import List
+import sys
+from array import array
+from collections import Counter
+from itertools import accumulate
+from typing import Any, Callable, List, Sequence
+
+# NumPy is optional and only imported for buffers and large record
+# lists, so lists of colors never pay for loading it
+np = None
+_numpy_missing = False
+
+
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def _is_ndarray(obj) -> bool:
+    """
+    isinstance(obj, np.ndarray) without importing NumPy: an array can only
+    exist once NumPy has been loaded.
+    """
+    return sys.modules.get("numpy") is not None and isinstance(obj, _numpy().ndarray)
+
+
+# partition_by_key imports NumPy for its argsort only from this many
+# records on; below that the counting loop is as fast as loading NumPy
+NUMPY_MIN_RECORDS = 1 << 12
+
+# Without NumPy, up to this many colors are counted with one bytes.count()
+# call per color instead of a single (slower) Counter pass
+BYTES_COUNT_MAX_COLORS = 16
+
+# Number of elements handed to np.bincount at a time
+COUNT_BLOCK_SIZE = 1 << 16
 
 
 def sort_colors(colors: List[int]) -> List[int]:
@@ -31,11 +101,16 @@ def sort_colors(colors: List[int]) -> List[int]:
     ensuring all 0s come first, followed by 1s, then 2s.
 
     Args:
-        colors: List of integers containing only 0, 1, and 2
+        colors: List of integers containing only 0, 1, and 2 (an integer
+            NumPy array is counted and rewritten by sort_colors_k)
         
     Returns:
         The same list sorted in-place with all 0s, 1s, and 2s grouped together
     """
+    # Integer NumPy input: count the colors and rewrite the array in bulk
+    if _is_ndarray(colors) and np.issubdtype(colors.dtype, np.integer):
+        return sort_colors_k(colors)
+
     # Initialize three pointers low/start, mid/current, and high/end
     low= 0
     mid = 0
@@ -64,6 +139,214 @@ def sort_colors(colors: List[int]) -> List[int]:
     return colors
 
 
+def sort_colors_k(colors, k: int = 3):
+    """
+    Sort an array of color codes 0 .. k-1 in-place.
+
+    Args:
+        colors: bytearray, array.array or NumPy array of integer codes
+            (counted and rewritten in bulk), or a list (Dutch National
+            Flag passes)
+        k: Number of colors (at most 256 for bytearray)
+
+    Returns:
+        The same object, sorted in-place
+    """
+    if _is_ndarray(colors) and np.issubdtype(colors.dtype, np.integer):
+        _fill_by_counts(colors, _count_codes_numpy(colors, k))
+    elif isinstance(colors, bytearray):
+        _fill_by_counts(colors, _count_codes_bytes(colors, k))
+    elif isinstance(colors, array) and colors.typecode in "bBhHiIlLqQ":
+        if _numpy() is not None:
+            counts = _count_codes_numpy(np.asarray(memoryview(colors)), k)
+        else:
+            counts = _count_codes_generic(colors, k)
+        _fill_by_counts(colors, counts)
+    else:
+        _dutch_flag_passes(colors, k)
+    return colors
+
+
+def _count_codes_bytes(colors: bytearray, k: int) -> List[int]:
+    """
+    Count each color of a byte buffer, in C.
+    """
+    if _numpy() is not None:
+        return _count_codes_numpy(np.frombuffer(colors, dtype=np.uint8), k)
+    if k <= BYTES_COUNT_MAX_COLORS:
+        counts = [colors.count(code) for code in range(k)]
+        if sum(counts) != len(colors):
+            raise ValueError(f"colors must be integers in range(0, {k})")
+        return counts
+    return _count_codes_generic(colors, k)
+
+
+def _count_codes_numpy(colors: "np.ndarray", k: int) -> List[int]:
+    """
+    Count each color of an integer NumPy array with np.bincount.
+
+    np.bincount widens its input to 64-bit integers, so the array is
+    counted in blocks to keep that temporary copy small.
+    """
+    counts = np.zeros(k, dtype=np.int64)
+    for start in range(0, colors.size, COUNT_BLOCK_SIZE):
+        block = colors[start:start + COUNT_BLOCK_SIZE]
+        if block.min() < 0 or block.max() >= k:
+            raise ValueError(f"colors must be integers in range(0, {k})")
+        counts += np.bincount(block, minlength=k)
+    return counts.tolist()
+
+
+def _count_codes_generic(colors, k: int) -> List[int]:
+    """
+    Count each color of any iterable of integer codes with a Counter.
+    """
+    counter = Counter(colors)
+    if any(not 0 <= code < k for code in counter):
+        raise ValueError(f"colors must be integers in range(0, {k})")
+    return [counter[code] for code in range(k)]
+
+
+def _fill_by_counts(colors, counts: List[int]) -> None:
+    """
+    Rewrite a buffer as counts[0] zeros, counts[1] ones, and so on, with
+    one bulk slice fill per color.
+    """
+    pos = 0
+    for code, count in enumerate(counts):
+        if count == 0:
+            continue
+        if isinstance(colors, bytearray):
+            colors[pos:pos + count] = bytes((code,)) * count
+        elif isinstance(colors, array):
+            colors[pos:pos + count] = array(colors.typecode, (code,)) * count
+        else:
+            colors[pos:pos + count] = code
+        pos += count
+
+
+def _dutch_flag_passes(colors, k: int) -> None:
+    """
+    Sort colors 0 .. k-1 with repeated Dutch National Flag passes.
+
+    Each pass works on the unsorted window [low, high]: the smallest
+    remaining color is swapped to the front, the largest to the back, and
+    both ends of the window move inward. With k == 3 this is exactly one
+    sort_colors pass.
+
+    A code outside range(0, k) is never moved, so it is still inside the
+    final window, which must only hold colors small .. large.
+    """
+    low = 0
+    high = len(colors) - 1
+    small = 0
+    large = k - 1
+
+    while small < large and low < high:
+        mid = low
+        while mid <= high:
+            if colors[mid] == small:
+                colors[low], colors[mid] = colors[mid], colors[low]
+                low += 1
+                mid += 1
+            elif colors[mid] == large:
+                colors[mid], colors[high] = colors[high], colors[mid]
+                high -= 1
+            else:
+                mid += 1
+
+        # Colors small and large are in place; sort the rest of the window
+        small += 1
+        large -= 1
+
+    for mid in range(low, high + 1):
+        if not small <= colors[mid] <= large:
+            raise ValueError(f"colors must be integers in range(0, {k})")
+
+
+# ────────────────────────────────────────────────
+# Stable Partition by Key
+# ────────────────────────────────────────────────
+def _compact_keys(records: Sequence[Any], key: Callable[[Any], int], buckets: int):
+    """
+    Compute key(record) once per record into the smallest integer array
+    that holds codes 0 .. buckets-1, checking that every code is in range.
+    """
+    try:
+        if buckets <= 256:
+            codes = bytes(map(key, records))
+        else:
+            codes = array("H" if buckets <= 1 << 16 else "Q", map(key, records))
+    except (ValueError, OverflowError, TypeError):
+        # Negative, too large for the array, or not an integer
+        raise ValueError(f"keys must be integers in range(0, {buckets})") from None
+
+    if np is not None:
+        # Zero-copy NumPy view of the same keys
+        dtype = {1: np.uint8, 2: np.uint16, 8: np.uint64}[getattr(codes, "itemsize", 1)]
+        codes = np.frombuffer(codes, dtype=dtype)
+        too_large = codes.size and codes.max() >= buckets
+    else:
+        too_large = max(codes, default=0) >= buckets
+
+    if too_large:
+        raise ValueError(f"keys must be integers in range(0, {buckets})")
+    return codes
+
+
+def partition_by_key(records: Sequence[Any], key: Callable[[Any], int],
+                     buckets: int, in_place: bool = False) -> List[Any]:
+    """
+    Group records by a small integer key, keeping their order inside each
+    group (a stable counting sort; no records are compared).
+
+    Args:
+        records: List (or other sequence) of arbitrary objects
+        key: Maps a record to its bucket, an integer in range(buckets)
+        buckets: Number of buckets
+        in_place: Also write the result back into records (which must then
+            be a mutable sequence, e.g. a list); the output list is still
+            built first, so this uses the same O(n) extra memory
+
+    Returns:
+        List of the records, bucket 0 first; records itself when in_place
+    """
+    if buckets < 1:
+        raise ValueError("buckets must be at least 1")
+    if not isinstance(records, Sequence):
+        records = list(records)
+
+    n = len(records)
+    use_numpy = buckets <= 1 << 16 and n >= NUMPY_MIN_RECORDS and _numpy() is not None
+    codes = _compact_keys(records, key, buckets)
+
+    if use_numpy:
+        # Counting and prefix-sum placement in C: a stable argsort of
+        # 8/16-bit keys is a radix sort, and fancy indexing of an object
+        # array gathers the records without Python-level work (wider keys
+        # would get a comparison sort, so they take the loop below)
+        order = np.argsort(codes, kind="stable")
+        out = np.fromiter(records, dtype=object, count=n)[order].tolist()
+    else:
+        # A memoryview yields plain ints from bytes, array or NumPy keys
+        codes = memoryview(codes)
+
+        # Counting pass, then the first free slot of every bucket
+        counts = _count_codes_generic(codes, buckets)
+        next_slot = [0, *accumulate(counts)][:buckets]
+
+        # Placement pass into a preallocated output, in input order
+        out = [None] * n
+        for record, code in zip(records, codes):
+            out[next_slot[code]] = record
+            next_slot[code] += 1
+
+    if in_place:
+        records[:] = out
+        return records
+    return out
+
+
  #────────────────────────────────────────────────
 # Demonstration / Manual Tests
 # ────────────────────────────────────────────────
@@ -115,3 +398,27 @@ if __name__ == "__main__":
     print(f"Expected: [1]")
     print()
     print("-" * 50)
+
+    # Test case-7: Five colors in a list (Dutch National Flag passes)
+    colors7 = [4, 1, 3, 0, 2, 4, 0, 3, 1]
+    print(f"Input: {colors7}")
+    print(f"Output: {sort_colors_k(colors7.copy(), k=5)}")
+    print(f"Expected: [0, 0, 1, 1, 2, 3, 3, 4, 4]")
+    print()
+    print("-" * 50)
+
+    # Test case-8: Byte-coded categories (counted and bulk-filled)
+    colors8 = bytearray([7, 2, 200, 2, 0, 7])
+    print(f"Input: {list(colors8)}")
+    print(f"Output: {list(sort_colors_k(colors8, k=256))}")
+    print(f"Expected: [0, 2, 2, 7, 7, 200]")
+    print()
+    print("-" * 50)
+
+    # Test case-9: Records grouped by a key, original order kept per group
+    records9 = [("b", 1), ("a", 0), ("c", 2), ("d", 1), ("e", 0)]
+    print(f"Input: {records9}")
+    print(f"Output: {partition_by_key(records9, key=lambda r: r[1], buckets=3)}")
+    print(f"Expected: [('a', 0), ('e', 0), ('b', 1), ('d', 1), ('c', 2)]")
+    print()
+    print("-" * 50)
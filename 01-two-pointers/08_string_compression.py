@@ -20,10 +20,96 @@ Time Complexity: O(n) - Single pass through the array
 
 Space Complexity: O(1) - In-place compression with constant extra space
 # Only using two pointer variables and a count variable
+
+Byte-buffer encoder (compress_buffer / encode_runs):
+- Same read/write pointers, but over bytes and one block at a time
+- Run boundaries of a whole block are found at once with
+  np.flatnonzero(block[1:] != block[:-1]); run lengths are their differences
+- The char + count digits of every run in the block are laid out with array
+  arithmetic and written back with one slice assignment
+- The last run of a block may continue in the next block, so it is carried
+  over instead of being written
+- The write pointer never passes the read pointer, so writing in-place is safe
+Time Complexity: O(n) - with no per-character Python work
+Space Complexity: O(block_size) - temporary arrays for one block
+
+Streaming encoder / decoder (iter_encode / iter_decode):
+- iter_encode reads fixed-size chunks and finds the runs of each chunk; the
+  last run may continue in the next chunk, so it is carried over (and merged
+  if the next chunk starts with the same byte) before being written
+- iter_decode parses "char + digits" tokens; a token cut by a chunk boundary
+  is carried over, and each run is expanded with bytes repetition
+  (char * count) instead of per-character appends
+- encode_file / decode_file pipe one file object into another
+- Like compress() itself, the format is only unambiguous when the data does
+  not contain ASCII digits
+Space Complexity: O(chunk_size) - whatever the stream length
+
+Compressed-domain operations (RunLengthSequence):
+- Parse the compress() output (chars[:k], or encoded bytes) once into two
+  parallel arrays: the character of every run and the cumulative run ends
+- seq[i] bisects the run ends to find the run holding position i
+- reverse() reverses the runs, not the characters
+- Runs are kept maximal (adjacent runs never share a character), so a
+  sequence is a palindrome exactly when its run characters and run lengths
+  both read the same backwards, and two sequences are equal exactly when
+  their runs are equal: both are two-pointer scans over the runs
+Time Complexity: O(log runs) - per access; O(runs) - reverse, palindrome
+check and equality
+Space Complexity: O(runs) - independent of the decoded length
 """
 
 
-from typing import List
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain, groupby, repeat
+from typing import Any, BinaryIO, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# NumPy is optional and only imported by the byte-buffer and streaming
+# codecs (which use a regex without it), so compress() never pays for it
+np = None
+_numpy_missing = False
+
+
+def _numpy():
+    """
+    Import NumPy on first use; None when it is not installed.
+    """
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def _is_ndarray(obj) -> bool:
+    """
+    isinstance(obj, np.ndarray) without importing NumPy: an array can only
+    exist once NumPy has been loaded.
+    """
+    return sys.modules.get("numpy") is not None and isinstance(obj, _numpy().ndarray)
+
+
+# Default number of bytes scanned for run boundaries at a time
+DEFAULT_BLOCK_SIZE = 1 << 22
+
+# Default number of bytes read (or produced) per step by the streaming codec
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# One run of identical bytes (fallback scanner when NumPy is missing)
+_RUN = re.compile(rb"(.)\1*", re.DOTALL)
+
+# One encoded run: the character, then its optional count
+_TOKEN = re.compile(rb"(.)([0-9]*)", re.DOTALL)
+
+# The same token, for compress() output joined into a str
+_TOKEN_STR = re.compile(r"(.)([0-9]*)", re.DOTALL)
 
 
 def compress(chars: List[str]) -> int:
@@ -93,6 +179,506 @@ def compress(chars: List[str]) -> int:
     return write_pos
 
 
+# ────────────────────────────────────────────────
+# Byte-Buffer Encoder
+# ────────────────────────────────────────────────
+def _encode_runs_numpy(values: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    """
+    Lay out runs in compress() format: the byte, then the count's ASCII
+    digits when the count is greater than one.
+
+    Args:
+        values (np.ndarray): Byte of every run
+        lengths (np.ndarray): Length of every run
+
+    Returns:
+        np.ndarray: Encoded bytes (uint8)
+    """
+    # 10 ** i for every digit position of a 64-bit run length
+    powers_of_ten = 10 ** np.arange(19, dtype=np.int64)
+
+    # Number of count digits per run (0 for runs of length 1)
+    digits = (lengths > 1).astype(np.int64)
+    for power in powers_of_ten[1:]:
+        if power > lengths.max(initial=0):
+            break
+        digits += lengths >= power
+
+    # Where every run starts in the output
+    sizes = digits + 1
+    offsets = np.cumsum(sizes) - sizes
+
+    encoded = np.empty(int(offsets[-1] + sizes[-1]) if sizes.size else 0, dtype=np.uint8)
+    encoded[offsets] = values
+
+    # Most counts are one digit: write those directly
+    single = digits == 1
+    encoded[offsets[single] + 1] = lengths[single] + ord("0")
+
+    # Longer counts: fill digit column j (most significant first)
+    multi = np.flatnonzero(digits > 1)
+    if multi.size:
+        for j in range(int(digits[multi].max())):
+            run = multi[digits[multi] > j]
+            place = powers_of_ten[digits[run] - 1 - j]
+            encoded[offsets[run] + 1 + j] = (lengths[run] // place) % 10 + ord("0")
+
+    return encoded
+
+
+def _compress_buffer_numpy(data: "np.ndarray", block_size: int) -> int:
+    """
+    compress_buffer for a writable uint8 array, block by block.
+    """
+    n = data.size
+    run_start = 0   # First byte of the run not written yet
+    write_pos = 0   # Where the next encoded byte goes
+    scanned = 1     # Bytes before this index were already compared
+
+    while scanned < n or run_start < n:
+        end = min(scanned + block_size, n)
+
+        # Boundaries in [scanned, end): data[p] differs from data[p - 1]
+        cuts = np.flatnonzero(data[scanned:end] != data[scanned - 1:end - 1]) + scanned
+        scanned = end
+
+        # The last run only ends here if the data ends here
+        if end == n:
+            cuts = np.append(cuts, n)
+        if cuts.size == 0:
+            continue
+
+        starts = np.concatenate(([run_start], cuts[:-1]))
+        encoded = _encode_runs_numpy(data[starts], cuts - starts)
+
+        # One bulk write per block; write_pos <= run_start, so this never
+        # overwrites bytes that are still to be read
+        data[write_pos:write_pos + encoded.size] = encoded
+        write_pos += encoded.size
+        run_start = int(cuts[-1])
+
+    return write_pos
+
+
+def _compress_buffer_regex(buf: Union[bytearray, memoryview]) -> int:
+    """
+    compress_buffer without NumPy: find runs with a regex scan.
+    """
+    parts = []
+    for match in _RUN.finditer(buf):
+        count = match.end() - match.start()
+        parts.append(match.group(1))
+        if count > 1:
+            parts.append(str(count).encode("ascii"))
+
+    encoded = b"".join(parts)
+    buf[:len(encoded)] = encoded
+    return len(encoded)
+
+
+def compress_buffer(buf, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    """
+    Compress a byte buffer in-place, in the same format as compress().
+
+    buf[:k] ends up holding exactly the bytes that compress() would produce
+    for the list of its characters (one character per byte).
+
+    Args:
+        buf: bytearray, writable memoryview, or 1-D uint8/int8 NumPy array
+        block_size (int): Bytes scanned for run boundaries at a time
+
+    Returns:
+        int: Length of the compressed data
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+
+    # len() and the uint8 view count bytes only for 1-byte items: an int32
+    # array would have its raw bytes reinterpreted as characters
+    view = memoryview(buf)
+    if view.itemsize != 1 or view.ndim != 1:
+        raise TypeError("compress_buffer() needs a 1-D buffer of 1-byte items")
+
+    if len(buf) <= 1:
+        return len(buf)
+
+    if _numpy() is None:
+        return _compress_buffer_regex(buf)
+
+    if isinstance(buf, np.ndarray):
+        data = buf.view(np.uint8)
+    else:
+        data = np.frombuffer(buf, dtype=np.uint8)
+    if not data.flags.writeable:
+        raise TypeError("compress_buffer() needs a writable buffer")
+
+    return _compress_buffer_numpy(data, block_size)
+
+
+def encode_runs(data, block_size: int = DEFAULT_BLOCK_SIZE) -> bytes:
+    """
+    Return the compress() encoding of a bytes-like object.
+
+    Args:
+        data: bytes, bytearray, memoryview or uint8 NumPy array
+        block_size (int): Bytes scanned for run boundaries at a time
+
+    Returns:
+        bytes: Compressed data
+    """
+    buf = bytearray(data)
+    k = compress_buffer(buf, block_size)
+    return bytes(buf[:k])
+
+
+# ────────────────────────────────────────────────
+# Streaming Encoder / Decoder
+# ────────────────────────────────────────────────
+def _chunk_runs(chunk: bytes) -> Tuple[List[int], List[int]]:
+    """
+    Split one chunk into runs.
+
+    Returns:
+        (values, lengths): Byte and length of every run, in order
+    """
+    if _numpy() is not None:
+        data = np.frombuffer(chunk, dtype=np.uint8)
+        starts = np.flatnonzero(data[1:] != data[:-1]) + 1
+        starts = np.concatenate(([0], starts))
+        lengths = np.diff(np.append(starts, data.size))
+        return data[starts].tolist(), lengths.tolist()
+
+    values, lengths = [], []
+    for match in _RUN.finditer(chunk):
+        values.append(chunk[match.start()])
+        lengths.append(match.end() - match.start())
+    return values, lengths
+
+
+def _encode_run_list(values: List[int], lengths: List[int]) -> bytes:
+    """
+    Encode complete runs in compress() format.
+    """
+    if len(values) > 1 and _numpy() is not None:
+        encoded = _encode_runs_numpy(np.array(values, dtype=np.uint8),
+                                     np.array(lengths, dtype=np.int64))
+        return encoded.tobytes()
+
+    parts = []
+    for value, length in zip(values, lengths):
+        parts.append(bytes((value,)))
+        if length > 1:
+            parts.append(str(length).encode("ascii"))
+    return b"".join(parts)
+
+
+def iter_encode(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Run-length encode a stream of byte chunks, in compress() format.
+
+    Joining the output gives exactly what compress() produces for the whole
+    stream, wherever the chunk boundaries fall.
+
+    Args:
+        chunks: Iterable of bytes-like chunks
+
+    Returns:
+        Iterator over encoded byte chunks
+    """
+    # The run still open at the end of the previous chunk
+    carry_value, carry_length = None, 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        values, lengths = _chunk_runs(bytes(chunk))
+
+        # Glue the carried run to the first run of this chunk, or emit it
+        if carry_value is not None:
+            if values[0] == carry_value:
+                lengths[0] += carry_length
+            else:
+                values.insert(0, carry_value)
+                lengths.insert(0, carry_length)
+
+        # The last run may continue in the next chunk: hold it back
+        carry_value, carry_length = values.pop(), lengths.pop()
+        if values:
+            yield _encode_run_list(values, lengths)
+
+    if carry_value is not None:
+        yield _encode_run_list([carry_value], [carry_length])
+
+
+def _iter_tokens(chunks: Iterable[bytes]) -> Iterator[Tuple[bytes, int]]:
+    """
+    Parse an encoded stream into (character, count) pairs.
+    """
+    carry = b""
+
+    for chunk in chunks:
+        data = carry + bytes(chunk)
+        if not data:
+            continue
+
+        # The last token may have more digits in the next chunk: keep it
+        tokens = list(_TOKEN.finditer(data))
+        carry = data[tokens[-1].start():]
+
+        for token in tokens[:-1]:
+            yield token.group(1), int(token.group(2) or 1)
+
+    # The final token is complete once the stream ends
+    if carry:
+        token = _TOKEN.match(carry)
+        yield token.group(1), int(token.group(2) or 1)
+
+
+def iter_decode(chunks: Iterable[bytes],
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Decode a stream produced by compress() / iter_encode.
+
+    Args:
+        chunks: Iterable of encoded bytes-like chunks
+        chunk_size (int): Approximate size of every decoded output chunk
+            (long runs are split, so memory stays bounded)
+
+    Returns:
+        Iterator over decoded byte chunks
+    """
+    # A run is split into pieces of at most chunk_size - size bytes, which
+    # would never shrink with chunk_size <= 0
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    parts = []
+    size = 0
+
+    for value, count in _iter_tokens(chunks):
+        # Common case: the whole run fits in the pending output
+        if size + count < chunk_size:
+            parts.append(value * count)
+            size += count
+            continue
+
+        # Otherwise expand it in pieces that never make the pending output
+        # larger than chunk_size
+        while count:
+            piece = min(count, chunk_size - size)
+            parts.append(value * piece)
+            size += piece
+            count -= piece
+            if size == chunk_size:
+                yield b"".join(parts)
+                parts, size = [], 0
+
+    if parts:
+        yield b"".join(parts)
+
+
+def _read_chunks(src: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a binary file object in fixed-size chunks.
+    """
+    return iter(lambda: src.read(chunk_size), b"")
+
+
+def encode_file(src: BinaryIO, dst: BinaryIO,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Run-length encode one binary file object into another.
+
+    Returns:
+        int: Number of encoded bytes written
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")   # read(0) would end the file early
+    written = 0
+    for encoded in iter_encode(_read_chunks(src, chunk_size)):
+        written += dst.write(encoded)
+    return written
+
+
+def decode_file(src: BinaryIO, dst: BinaryIO,
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Decode one binary file object (compress() format) into another.
+
+    Returns:
+        int: Number of decoded bytes written
+    """
+    written = 0
+    for decoded in iter_decode(_read_chunks(src, chunk_size), chunk_size):
+        written += dst.write(decoded)
+    return written
+
+
+# ────────────────────────────────────────────────
+# Compressed-Domain Operations
+# ────────────────────────────────────────────────
+class RunLengthSequence:
+    """
+    A sequence stored as runs: run characters plus cumulative run ends.
+
+    Example:
+        chars = list("aaabbbbaaa")
+        k = compress(chars)                       # chars[:k] == list("a3b4a3")
+        seq = RunLengthSequence.from_compressed(chars[:k])
+        len(seq), seq[4]                          # (10, 'b')
+        seq.is_palindrome()                       # True
+
+    Elements are str characters when built from a list of str, and ints
+    (like bytes indexing) when built from bytes.
+    """
+
+    def __init__(self, runs: Iterable[Tuple[Any, int]] = (), binary: bool = False) -> None:
+        """
+        Args:
+            runs: (character, length) pairs; empty runs are dropped and
+                neighbouring runs of the same character are merged
+            binary: Characters are byte values (ints); decode() and
+                encode() then return bytes
+        """
+        self._binary = binary
+        self._chars: List[Any] = []
+        lengths: List[int] = []
+        for char, length in runs:
+            if length < 0:
+                raise ValueError("run lengths must not be negative")
+            if length == 0:
+                continue
+            if self._chars and self._chars[-1] == char:
+                lengths[-1] += length
+            else:
+                self._chars.append(char)
+                lengths.append(length)
+
+        # _ends[r] = number of elements in runs 0 .. r
+        self._ends = array("q", accumulate(lengths))
+
+    @classmethod
+    def from_compressed(cls, encoded: Union[Sequence[str], bytes, bytearray, memoryview]
+                        ) -> "RunLengthSequence":
+        """
+        Build from compress() output without decoding it.
+
+        Args:
+            encoded: chars[:k] after k = compress(chars), or the bytes of
+                compress_buffer / encode_runs / iter_encode
+
+        Returns:
+            RunLengthSequence of the original data
+        """
+        if isinstance(encoded, (bytes, bytearray, memoryview)):
+            data = bytes(encoded)
+            return cls(((data[token.start()], int(token.group(2) or 1))
+                        for token in _TOKEN.finditer(data)), binary=True)
+        text = "".join(encoded)
+        return cls((token.group(1), int(token.group(2) or 1))
+                   for token in _TOKEN_STR.finditer(text))
+
+    @classmethod
+    def from_sequence(cls, values: Iterable[Any]) -> "RunLengthSequence":
+        """
+        Build from decoded data (a list of characters, a str, bytes, ...).
+        """
+        binary = isinstance(values, (bytes, bytearray, memoryview))
+        return cls(((value, sum(1 for _ in group)) for value, group in groupby(values)),
+                   binary=binary)
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @property
+    def run_count(self) -> int:
+        return len(self._chars)
+
+    def runs(self) -> Iterator[Tuple[Any, int]]:
+        """
+        (character, length) of every run, in order.
+        """
+        start = 0
+        for char, end in zip(self._chars, self._ends):
+            yield char, end - start
+            start = end
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Element at a position of the decoded sequence, found by bisecting
+        the run ends. O(log runs).
+        """
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("RunLengthSequence index out of range")
+        return self._chars[bisect_right(self._ends, index)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(repeat(char, length) for char, length in self.runs())
+
+    def reverse(self) -> None:
+        """
+        Reverse the decoded sequence in-place, one run at a time. O(runs).
+        """
+        lengths = [length for _, length in self.runs()]
+        self._chars.reverse()
+        self._ends = array("q", accumulate(reversed(lengths)))
+
+    def is_palindrome(self) -> bool:
+        """
+        True if the decoded sequence reads the same backwards (exact
+        comparison, unlike is_palindrome's alphanumeric-only rule). O(runs).
+        """
+        # Two pointers over the runs: characters and lengths must mirror,
+        # except the length of the middle run, which mirrors itself
+        left = 0
+        right = len(self._chars) - 1
+        while left < right:
+            if self._chars[left] != self._chars[right]:
+                return False
+            left_length = self._ends[left] - (self._ends[left - 1] if left else 0)
+            right_length = self._ends[right] - self._ends[right - 1]
+            if left_length != right_length:
+                return False
+            left += 1
+            right -= 1
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Equality of the decoded sequences, compared run by run. O(runs).
+        """
+        if not isinstance(other, RunLengthSequence):
+            return NotImplemented
+        return self._ends == other._ends and self._chars == other._chars
+
+    def decode(self) -> Union[List[str], bytes]:
+        """
+        The decoded data: a list of characters, or bytes for byte runs.
+        """
+        if self._binary:
+            return b"".join(bytes((char,)) * length for char, length in self.runs())
+        return list(self)
+
+    def encode(self) -> Union[List[str], bytes]:
+        """
+        The runs in compress() format (what chars[:k] would hold).
+        """
+        if self._binary:
+            return _encode_run_list(self._chars, [length for _, length in self.runs()])
+        out: List[str] = []
+        for char, length in self.runs():
+            out.append(char)
+            if length > 1:
+                out.extend(str(length))
+        return out
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.runs())!r})"
+
+
 #────────────────────────────────────────────────
 # Demonstration / Manual Tests
 #────────────────────────────────────────────────
@@ -156,3 +742,32 @@ if __name__ == "__main__":
     print(f"Expected: ['a', '2'] | Length: 2")
     print()
     print("-" * 50)
+
+    # Test case-7: Byte buffer, compressed in-place
+    chars7 = bytearray(b"aaabccccccccccccd")
+    original7 = bytes(chars7)
+    result7 = compress_buffer(chars7)
+    print(f"Input: {original7}")
+    print(f"Output: {bytes(chars7[:result7])} | Length: {result7}")
+    print(f"Expected: b'a3bc12d' | Length: 7")
+    print()
+    print("-" * 50)
+
+    # Test case-8: Streaming round trip with tiny chunks
+    chunks8 = [b"aaab", b"bbbb", b"bbbbbc", b"d"]
+    encoded8 = b"".join(iter_encode(chunks8))
+    decoded8 = b"".join(iter_decode([encoded8[i:i + 2] for i in range(0, len(encoded8), 2)]))
+    print(f"Input: {chunks8}")
+    print(f"Output: {encoded8} -> {decoded8}")
+    print(f"Expected: b'a3b10cd' -> b'aaabbbbbbbbbbcd'")
+    print()
+    print("-" * 50)
+
+    # Test case-9: Operations on the compressed form, without decoding
+    chars9 = list("aaabbbbaaa")
+    seq9 = RunLengthSequence.from_compressed(chars9[:compress(chars9)])
+    print(f"Input: {list('aaabbbbaaa')} -> {seq9.encode()}")
+    print(f"Output: len={len(seq9)}, seq[4]={seq9[4]!r}, palindrome={seq9.is_palindrome()}")
+    print(f"Expected: len=10, seq[4]='b', palindrome=True")
+    print()
+    print("-" * 50)
@@ -0,0 +1,73 @@
+"""
+Benchmark: three_sum (pure Python two pointers) vs three_sum_numpy
+(vectorized inner search) on seeded random inputs.
+
+Usage:
+    python benchmarks/bench_three_sum.py
+    python benchmarks/bench_three_sum.py --sizes 1000 4000 16000 --repeat 3
+"""
+import argparse
+import importlib.util
+import random
+import time
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "01-two-pointers" / "06_3sum.py"
+
+
+def load_module():
+    """
+    Load 06_3sum.py (its name is not a valid Python identifier).
+    """
+    spec = importlib.util.spec_from_file_location("three_sum_module", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_time(func, make_input, repeat):
+    """
+    Return the best wall time of func over `repeat` fresh inputs, plus the
+    last result.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        nums = make_input()
+        start = time.perf_counter()
+        result = func(nums)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    """
+    Time both engines over a range of sizes and print the speedup.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    module = load_module()
+    if module.np is None:
+        print("NumPy is not installed; three_sum_numpy falls back to three_sum_counts")
+
+    print(f"{'n':>8} {'triplets':>10} {'python (s)':>12} {'numpy (s)':>12} {'speedup':>9}")
+    for n in args.sizes:
+        # Values spread over ~n² so the result list stays small and the
+        # timing measures the scan, not the output
+        rng = random.Random(args.seed + n)
+        data = [rng.randint(-n * n, n * n) for _ in range(n)]
+
+        python_time, expected = best_time(module.three_sum, data.copy, args.repeat)
+        numpy_time, result = best_time(module.three_sum_numpy, data.copy, args.repeat)
+        assert result == expected, "engines disagree"
+
+        print(f"{n:>8} {len(result):>10} {python_time:>12.4f} {numpy_time:>12.4f} "
+              f"{python_time / numpy_time:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Empirical check of the Time / Space claims in the module docstrings.
+
+Every check runs one function over a geometric range of sizes with an
+adversarial input generator, then fits the log-log slope of
+- wall time against n
+- peak traced allocation (tracemalloc) against n
+and fails when a slope is steeper than the exponent of the documented
+class, e.g. an accidental quadratic in compress (slope ~2 vs O(n)) or a
+hidden copy in reverse_string (space slope ~1 vs O(1)).
+
+The claims are read from the docstrings themselves: the header section
+documents the main function, and a section whose heading names a function,
+such as "File mode (is_palindrome_file):", documents that function.
+
+Usage:
+    python benchmarks/complexity.py
+    python benchmarks/complexity.py --checks compress three_sum --repeat 5
+    python benchmarks/complexity.py --json report.json
+"""
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from suite import (_cleanup, _file_with, gen_chars, gen_colors, gen_heavy_duplicate_3sum,
+                   gen_long_runs, gen_noisy_palindrome, gen_sentinel_ints, gen_sorted_signed,
+                   load)
+
+# Slack on a fitted slope before it counts as a violation (timing noise)
+DEFAULT_TOLERANCE = 0.3
+
+# Extra slack for a log factor in the claim, e.g. O(n log n)
+LOG_ALLOWANCE = 0.15
+
+# Peaks below this many bytes count as constant (interpreter noise)
+SPACE_FLOOR = 1 << 14
+
+# Scratch size passed to the functions whose space is O(block/chunk size)
+SMALL_BLOCK = 1 << 12
+
+LINEAR_SIZES = [1 << e for e in range(12, 19)]
+QUADRATIC_SIZES = [125, 250, 500, 1000, 2000]
+
+
+class Check(NamedTuple):
+    """
+    One function and the inputs used to verify its documented complexity.
+
+    name:     label in reports
+    module:   file whose docstring holds the claim
+    function: function the claim is looked up for
+    generate: seeded adversarial input of size n
+    prepare:  turns the input into call arguments (not measured)
+    call:     runs the function on those arguments (measured)
+    sizes:    values of n
+    note:     caveat printed with the result
+    """
+    name: str
+    module: str
+    function: str
+    generate: Callable[[int, random.Random], Any]
+    prepare: Callable[[Any], Any]
+    call: Callable[[Any, Any], Any]
+    sizes: List[int]
+    note: str = ""
+
+
+# ────────────────────────────────────────────────
+# Docstring Claims
+# ────────────────────────────────────────────────
+# "Some mode (name_a / name_b):" starts the section documenting name_a and
+# name_b; a heading without names takes them from its "- name: ..." bullets
+_HEADING = re.compile(r"^[^\s-].*:\s*$")
+_NAMES = re.compile(r"\(([^()]*)\):\s*$")
+_BULLET = re.compile(r"^- ([A-Za-z_]\w*):")
+_CLAIM = re.compile(r"^(Time|Space)(?: Complexity)?:\s*(O\(.*)$")
+
+
+def _big_o(text: str) -> str:
+    """
+    The first O(...) expression of a claim line, with nested parentheses.
+    """
+    depth = 0
+    for end, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return text[:end + 1]
+    return text
+
+
+def claims(module) -> Dict[str, Dict[str, str]]:
+    """
+    Time and space claims of a module, per docstring section.
+
+    Returns:
+        {function name or "main": {"time": "O(...)", "space": "O(...)"}}
+    """
+    sections: Dict[str, Dict[str, str]] = {"main": {}}
+    current = [sections["main"]]
+
+    named = True    # False while the names come from bullets
+
+    for line in (module.__doc__ or "").splitlines():
+        claim = _CLAIM.match(line.strip())
+        if claim:
+            for section in current:
+                section.setdefault(claim.group(1).lower(), _big_o(claim.group(2)))
+        elif line.startswith("Approach:"):
+            current, named = [sections["main"]], True
+        elif _HEADING.match(line):
+            names = _NAMES.search(line)
+            current, named = [], names is not None
+            for name in re.findall(r"[A-Za-z_]\w*", names.group(1) if names else ""):
+                current.append(sections.setdefault(name, {}))
+        elif not named and _BULLET.match(line):
+            current.append(sections.setdefault(_BULLET.match(line).group(1), {}))
+    return sections
+
+
+def claim_for(module, function: str, kind: str) -> Optional[str]:
+    """
+    The documented time or space class of one function, if any; a section
+    that documents only one of the two falls back to the header's claim.
+    """
+    sections = claims(module)
+    return sections.get(function, {}).get(kind) or sections["main"].get(kind)
+
+
+def growth_exponent(claim: str) -> Optional[Tuple[float, bool]]:
+    """
+    Polynomial degree in n of a claim, plus whether it has a log factor.
+
+    Only n counts as growing; names such as k, block_size or chunk_size are
+    fixed by the check. O(n^(k-1)) and similar cannot be checked: None.
+    """
+    body = claim[2:-1]
+    has_log = "log" in body
+    exponent = 0.0
+    for term in body.split("+"):
+        term = re.sub(r"log\s*\w+", "", term)     # log n, log k, ...
+        if not re.search(r"\bn(?![a-z_])", term):
+            continue
+        if re.search(r"n\s*\^\s*\(", term):
+            return None
+        power = re.search(r"n\s*(²|³|\^\s*(\d+))", term)
+        if power is None:
+            degree = 1.0
+        elif power.group(1) == "²":
+            degree = 2.0
+        elif power.group(1) == "³":
+            degree = 3.0
+        else:
+            degree = float(power.group(2))
+        exponent = max(exponent, degree)
+    return exponent, has_log
+
+
+# ────────────────────────────────────────────────
+# Adversarial Generators
+# ────────────────────────────────────────────────
+def gen_odd_distinct(n: int, rng: random.Random) -> List[int]:
+    """
+    n distinct odd integers around zero: three odd numbers never sum to 0,
+    so three_sum scans every pair without finding (and storing) anything.
+    """
+    return [2 * v + 1 for v in rng.sample(range(-2 * n, 2 * n), n)]
+
+
+def gen_ascending_pairs(n: int, rng: random.Random) -> List[int]:
+    """
+    n sorted integers, each value once or twice, so remove_duplicates writes
+    on almost every step. The values are created in ascending order: the
+    sorted output of suite.gen_sorted_duplicates points at int objects
+    scattered over the heap, and at large n cache misses on those objects
+    (not the algorithm) bend the time curve upwards.
+    """
+    nums: List[int] = []
+    value = 0
+    while len(nums) < n:
+        nums.extend([value] * rng.randint(1, 2))
+        value += 1
+    return nums[:n]
+
+
+def gen_sorted_shards(n: int, rng: random.Random) -> List[List[int]]:
+    """
+    Four sorted shards of about n / 4 values each, overlapping.
+    """
+    return [sorted(rng.randrange(n) for _ in range(n // 4)) for _ in range(4)]
+
+
+# ────────────────────────────────────────────────
+# Checks
+# ────────────────────────────────────────────────
+def _same(value: Any) -> Any:
+    return value
+
+
+def _ascii_bytes(chars: List[str]) -> bytearray:
+    return bytearray("".join(chars), "ascii")
+
+
+def _small_chunks(data: bytes):
+    return (data[i:i + SMALL_BLOCK] for i in range(0, len(data), SMALL_BLOCK))
+
+
+CHECKS: List[Check] = [
+    Check("is_palindrome", "01_valid_palindrome.py", "is_palindrome",
+          gen_noisy_palindrome, _same, lambda m, s: m.is_palindrome(s), LINEAR_SIZES),
+    Check("is_palindrome_file", "01_valid_palindrome.py", "is_palindrome_file",
+          gen_noisy_palindrome, _file_with,
+          lambda m, path: m.is_palindrome_file(path, block_size=SMALL_BLOCK), LINEAR_SIZES,
+          "block_size fixed at 4 KiB"),
+    Check("reverse_string", "02_reverse_string.py", "reverse_string",
+          gen_chars, _same, lambda m, chars: m.reverse_string(chars), LINEAR_SIZES),
+    Check("reverse_buffer", "02_reverse_string.py", "reverse_buffer",
+          gen_chars, _ascii_bytes,
+          lambda m, buf: m.reverse_buffer(buf, chunk_size=SMALL_BLOCK), LINEAR_SIZES,
+          "chunk_size fixed at 4 KiB"),
+    Check("remove_element", "03_remove_element.py", "remove_element",
+          gen_sentinel_ints, _same, lambda m, nums: m.remove_element(nums, 0), LINEAR_SIZES),
+    Check("remove_duplicates", "04_remove_duplicates_from_sorted_array.py", "remove_duplicates",
+          gen_ascending_pairs, _same, lambda m, nums: m.remove_duplicates(nums), LINEAR_SIZES),
+    Check("merge_unique", "04_remove_duplicates_from_sorted_array.py", "merge_unique",
+          gen_sorted_shards, _same,
+          lambda m, shards: sum(1 for _ in m.merge_unique(*shards)), LINEAR_SIZES,
+          "k fixed at 4 sources"),
+    Check("sorted_squares", "05_squares_of_a_sorted_array.py", "sorted_squares",
+          gen_sorted_signed, _same, lambda m, nums: m.sorted_squares(nums), LINEAR_SIZES),
+    Check("three_sum", "06_3sum.py", "three_sum",
+          gen_odd_distinct, sorted, lambda m, nums: m.three_sum(nums), QUADRATIC_SIZES,
+          "input pre-sorted: the O(1) space claim excludes the sort"),
+    Check("count_three_sum", "06_3sum.py", "count_three_sum",
+          gen_heavy_duplicate_3sum, sorted, lambda m, nums: m.count_three_sum(nums),
+          QUADRATIC_SIZES, "input pre-sorted; many triplets, none stored"),
+    Check("sort_colors", "07_sort_colors.py", "sort_colors",
+          gen_colors, _same, lambda m, colors: m.sort_colors(colors), LINEAR_SIZES),
+    Check("compress", "08_string_compression.py", "compress",
+          gen_chars, _same, lambda m, chars: m.compress(chars), LINEAR_SIZES),
+    Check("compress_buffer", "08_string_compression.py", "compress_buffer",
+          gen_long_runs, _ascii_bytes,
+          lambda m, buf: m.compress_buffer(buf, block_size=SMALL_BLOCK), LINEAR_SIZES,
+          "block_size fixed at 4 KiB"),
+    Check("iter_encode", "08_string_compression.py", "iter_encode",
+          gen_long_runs, lambda chars: "".join(chars).encode("ascii"),
+          lambda m, data: sum(map(len, m.iter_encode(_small_chunks(data)))), LINEAR_SIZES,
+          "4 KiB chunks"),
+]
+
+
+# ────────────────────────────────────────────────
+# Measurement
+# ────────────────────────────────────────────────
+def measure(check: Check, n: int, seed: int, repeat: int) -> Tuple[float, int]:
+    """
+    Best wall time over `repeat` fresh inputs, and the peak memory
+    allocated by one more call (traced separately, since tracing slows the
+    interpreter down).
+    """
+    module = load(check.module)
+    best = float("inf")
+    for r in range(repeat + 1):
+        rng = random.Random(f"{check.name}:{n}:{seed}:{r}")
+        args = check.prepare(check.generate(n, rng))
+        try:
+            if r < repeat:
+                start = time.perf_counter()
+                check.call(module, args)
+                best = min(best, time.perf_counter() - start)
+            else:
+                # Only allocations made by the call itself are traced
+                tracemalloc.start()
+                try:
+                    check.call(module, args)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+        finally:
+            _cleanup(args)
+    return best, peak
+
+
+def slope(sizes: List[int], values: List[float]) -> float:
+    """
+    Theil-Sen slope of log(value) against log(n): the median of the slopes
+    between every pair of sizes. Unlike least squares, a single step where
+    the input falls out of a cache level does not tilt the whole fit.
+    """
+    points = [(math.log(n), math.log(max(v, 1e-12))) for n, v in zip(sizes, values)]
+    slopes = sorted((y2 - y1) / (x2 - x1)
+                    for i, (x1, y1) in enumerate(points)
+                    for x2, y2 in points[i + 1:])
+    middle = len(slopes) // 2
+    if len(slopes) % 2:
+        return slopes[middle]
+    return (slopes[middle - 1] + slopes[middle]) / 2
+
+
+def verdict(claim: Optional[str], measured: float, tolerance: float) -> str:
+    """
+    "ok", "FAIL" or "unchecked" for one fitted slope against a claim.
+    """
+    if claim is None:
+        return "unchecked"
+    parsed = growth_exponent(claim)
+    if parsed is None:
+        return "unchecked"
+    exponent, has_log = parsed
+    allowed = exponent + tolerance + (LOG_ALLOWANCE if has_log else 0.0)
+    return "ok" if measured <= allowed else "FAIL"
+
+
+def run_checks(checks: List[Check], seed: int, repeat: int, tolerance: float,
+               report=print) -> List[Dict[str, Any]]:
+    """
+    Measure every check and compare its slopes with the documented claims.
+    """
+    results = []
+    for check in checks:
+        module = load(check.module)
+        time_claim = claim_for(module, check.function, "time")
+        space_claim = claim_for(module, check.function, "space")
+
+        times, peaks = [], []
+        for n in check.sizes:
+            seconds, peak = measure(check, n, seed, repeat)
+            times.append(seconds)
+            peaks.append(max(peak, SPACE_FLOOR))
+
+        time_slope = slope(check.sizes, times)
+        space_slope = slope(check.sizes, peaks)
+        result = {
+            "check": check.name,
+            "time_claim": time_claim,
+            "time_slope": round(time_slope, 2),
+            "time": verdict(time_claim, time_slope, tolerance),
+            "space_claim": space_claim,
+            "space_slope": round(space_slope, 2),
+            "space": verdict(space_claim, space_slope, tolerance),
+            "peak_bytes": dict(zip(map(str, check.sizes), peaks)),
+            "note": check.note,
+        }
+        results.append(result)
+        report(f"{check.name:<20} time {str(time_claim):<12} slope {time_slope:5.2f} "
+               f"{result['time']:<9}  space {str(space_claim):<16} slope {space_slope:5.2f} "
+               f"{result['space']:<9} {check.note}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the checks; return 1 when a measured growth exceeds its claim.
+    """
+    parser = argparse.ArgumentParser(description="Verify documented complexity classes")
+    parser.add_argument("--checks", nargs="+", choices=[c.name for c in CHECKS],
+                        help="checks to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="inputs timed per size (best wins)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="slope slack before a claim counts as violated")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    args = parser.parse_args(argv)
+
+    checks = [c for c in CHECKS if not args.checks or c.name in args.checks]
+    results = run_checks(checks, args.seed, args.repeat, args.tolerance)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    failures = [r["check"] for r in results if "FAIL" in (r["time"], r["space"])]
+    if failures:
+        print("Growth exceeds the documented class:", ", ".join(failures))
+        return 1
+    print("All measured growth rates match their documented classes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+Scaling benchmark suite for the 01-two-pointers modules.
+
+Every case is one workload (a seeded input generator) timed for every
+backend that implements it: the pure-Python reference first, then the
+alternative backends (NumPy, buffers, streaming, ...) side by side.
+Sizes grow geometrically; a backend stops growing once the next size would
+take longer than the time budget.
+
+Usage:
+    python benchmarks/suite.py                              # print a table
+    python benchmarks/suite.py --save baseline.json         # record a baseline
+    python benchmarks/suite.py --compare baseline.json      # flag regressions
+    python benchmarks/suite.py --cases three_sum compress --max-exp 5
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+MODULE_DIR = ROOT / "01-two-pointers"
+
+# The modules are loaded through the two_pointers package, so they are
+# importable by name in the process pool of three_sum_parallel
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+import two_pointers  # noqa: E402
+
+# A time measurement this much slower than the baseline is a regression
+DEFAULT_THRESHOLD = 1.25
+
+# Measurements faster than this are too noisy to flag as regressions
+NOISE_FLOOR = 1e-3
+
+def load(filename: str):
+    """
+    Load (once) one of the numbered modules, e.g. "06_3sum.py", as
+    two_pointers.06_3sum.
+    """
+    return two_pointers.load_module(Path(filename).stem)
+
+
+class Backend(NamedTuple):
+    """
+    One implementation of a workload.
+
+    name:     label in reports ("python" is the reference)
+    module:   file that defines it
+    prepare:  turns the generated input into call arguments (not timed)
+    call:     runs the implementation on those arguments (timed)
+    needs_numpy: skipped when the module could not import NumPy
+    """
+    name: str
+    module: str
+    prepare: Callable[[Any], Any]
+    call: Callable[[Any, Any], Any]
+    needs_numpy: bool = False
+
+
+class Case(NamedTuple):
+    """
+    One workload: a seeded generator and the backends that run it.
+    """
+    name: str
+    generate: Callable[[int, random.Random], Any]
+    backends: List[Backend]
+
+
+# ────────────────────────────────────────────────
+# Seeded Input Generators
+# ────────────────────────────────────────────────
+def gen_noisy_palindrome(n: int, rng: random.Random) -> str:
+    """
+    Palindrome of about n characters with punctuation noise and mixed case,
+    so both pointers walk the whole string.
+    """
+    half = rng.choices(string.ascii_letters + string.digits, k=n // 4)
+    noise = rng.choices(" ,.!?:;'-", k=n // 4)
+    left = "".join(a + b for a, b in zip(half, noise))
+    right = "".join(a + b for a, b in zip(noise, half))[::-1]
+    return left + right.swapcase()
+
+
+def gen_chars(n: int, rng: random.Random) -> List[str]:
+    """
+    n random lowercase characters.
+    """
+    return rng.choices(string.ascii_lowercase, k=n)
+
+
+def gen_sentinel_ints(n: int, rng: random.Random) -> List[int]:
+    """
+    n integers in [0, 100); the sentinels 0..9 make up about 10%.
+    """
+    return [rng.randrange(100) for _ in range(n)]
+
+
+def gen_sorted_duplicates(n: int, rng: random.Random) -> List[int]:
+    """
+    n sorted integers where every value repeats about 8 times.
+    """
+    return sorted(rng.randrange(max(1, n // 8)) for _ in range(n))
+
+
+def gen_sorted_signed(n: int, rng: random.Random) -> List[int]:
+    """
+    n sorted integers spread around zero.
+    """
+    return sorted(rng.randint(-n, n) for _ in range(n))
+
+
+def gen_heavy_duplicate_3sum(n: int, rng: random.Random) -> List[int]:
+    """
+    n readings drawn from only ~sqrt(n) distinct values around zero.
+    """
+    spread = max(2, int(n ** 0.5) // 2)
+    return [rng.randint(-spread, spread) for _ in range(n)]
+
+
+def gen_colors(n: int, rng: random.Random) -> List[int]:
+    """
+    n colors, mostly 2s (the swap-heavy case for Dutch National Flag).
+    """
+    return rng.choices((0, 1, 2), weights=(1, 1, 4), k=n)
+
+
+def gen_long_runs(n: int, rng: random.Random) -> List[str]:
+    """
+    About n characters made of runs of 1 to 200 identical letters.
+    """
+    chars: List[str] = []
+    while len(chars) < n:
+        chars.extend(rng.choice(string.ascii_lowercase) * rng.randint(1, 200))
+    return chars[:n]
+
+
+# ────────────────────────────────────────────────
+# Cases
+# ────────────────────────────────────────────────
+def _file_with(text: str) -> str:
+    """
+    Write text to a temporary file (not timed) and return its path.
+    """
+    fd, path = tempfile.mkstemp(prefix="bench_")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    return path
+
+
+def _ints_to_array(nums: List[int]):
+    """
+    Convert generated integers to a NumPy array (only for NumPy backends).
+    """
+    import numpy as np
+    return np.array(nums, dtype=np.int64)
+
+
+CASES: List[Case] = [
+    Case("valid_palindrome", gen_noisy_palindrome, [
+        Backend("python", "01_valid_palindrome.py",
+                lambda s: s, lambda m, s: m.is_palindrome(s)),
+        Backend("mmap_file", "01_valid_palindrome.py",
+                _file_with, lambda m, path: m.is_palindrome_file(path)),
+        Backend("numpy_batch", "01_valid_palindrome.py",
+                lambda s: [s], lambda m, batch: m.is_palindrome_batch(batch), True),
+    ]),
+    Case("reverse_string", gen_chars, [
+        Backend("python", "02_reverse_string.py",
+                lambda chars: chars, lambda m, chars: m.reverse_string(chars)),
+        Backend("buffer", "02_reverse_string.py",
+                lambda chars: bytearray("".join(chars), "ascii"),
+                lambda m, buf: m.reverse_buffer(buf)),
+    ]),
+    Case("remove_element", gen_sentinel_ints, [
+        Backend("python", "03_remove_element.py",
+                lambda nums: nums, lambda m, nums: m.remove_element(nums, 0)),
+        Backend("multi_value", "03_remove_element.py",
+                lambda nums: nums, lambda m, nums: m.remove_elements(nums, range(10))),
+        Backend("array", "03_remove_element.py",
+                lambda nums: array("q", nums),
+                lambda m, nums: m.remove_elements(nums, range(10))),
+        Backend("numpy", "03_remove_element.py",
+                _ints_to_array, lambda m, nums: m.remove_elements(nums, range(10)), True),
+    ]),
+    Case("remove_duplicates", gen_sorted_duplicates, [
+        Backend("python", "04_remove_duplicates_from_sorted_array.py",
+                lambda nums: nums, lambda m, nums: m.remove_duplicates(nums)),
+        Backend("streaming", "04_remove_duplicates_from_sorted_array.py",
+                lambda nums: nums, lambda m, nums: sum(1 for _ in m.iter_unique(nums))),
+    ]),
+    Case("sorted_squares", gen_sorted_signed, [
+        Backend("python", "05_squares_of_a_sorted_array.py",
+                lambda nums: nums, lambda m, nums: m.sorted_squares(nums)),
+        Backend("numpy", "05_squares_of_a_sorted_array.py",
+                _ints_to_array, lambda m, nums: m.sorted_squares(nums), True),
+    ]),
+    Case("three_sum", gen_heavy_duplicate_3sum, [
+        Backend("python", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: m.three_sum(nums)),
+        Backend("counts", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: m.three_sum_counts(nums)),
+        Backend("numpy", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: m.three_sum_numpy(nums), True),
+        Backend("parallel", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: m.three_sum_parallel(nums)),
+        Backend("streaming", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: sum(1 for _ in m.iter_three_sum(nums))),
+        Backend("count", "06_3sum.py",
+                lambda nums: nums, lambda m, nums: m.count_three_sum(nums)),
+    ]),
+    Case("sort_colors", gen_colors, [
+        Backend("python", "07_sort_colors.py",
+                lambda colors: colors, lambda m, colors: m.sort_colors(colors)),
+        Backend("bytearray", "07_sort_colors.py",
+                bytearray, lambda m, colors: m.sort_colors_k(colors, 3)),
+        Backend("numpy", "07_sort_colors.py",
+                _ints_to_array, lambda m, colors: m.sort_colors_k(colors, 3), True),
+    ]),
+    Case("compress", gen_long_runs, [
+        Backend("python", "08_string_compression.py",
+                lambda chars: chars, lambda m, chars: m.compress(chars)),
+        Backend("buffer", "08_string_compression.py",
+                lambda chars: bytearray("".join(chars), "ascii"),
+                lambda m, buf: m.compress_buffer(buf)),
+        Backend("streaming", "08_string_compression.py",
+                lambda chars: "".join(chars).encode("ascii"),
+                lambda m, data: sum(map(len, m.iter_encode(
+                    data[i:i + (1 << 20)] for i in range(0, len(data), 1 << 20))))),
+    ]),
+]
+
+
+# ────────────────────────────────────────────────
+# Measurement
+# ────────────────────────────────────────────────
+def _cleanup(args: Any) -> None:
+    """
+    Remove the temporary file a prepare step may have created.
+    """
+    if isinstance(args, str) and os.path.basename(args).startswith("bench_"):
+        os.unlink(args)
+
+
+def time_backend(case: Case, backend: Backend, n: int, seed: int, repeat: int) -> float:
+    """
+    Best wall time of one backend at size n over `repeat` fresh inputs.
+    Generating and preparing the inputs is not timed.
+    """
+    module = load(backend.module)
+    best = float("inf")
+    for r in range(repeat):
+        rng = random.Random(f"{case.name}:{n}:{seed}:{r}")
+        args = backend.prepare(case.generate(n, rng))
+        try:
+            start = time.perf_counter()
+            backend.call(module, args)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            _cleanup(args)
+    return best
+
+
+def predict(timings: Dict[str, float], n: int) -> float:
+    """
+    Extrapolate the time at size n from the last two measurements, using
+    their observed growth exponent (at least linear).
+    """
+    points = [(int(k), v) for k, v in timings.items()]
+    if not points:
+        return 0.0
+    n2, t2 = points[-1]
+    exponent = 1.0
+    if len(points) > 1:
+        n1, t1 = points[-2]
+        if t1 > 0 and t2 > 0:
+            exponent = max(1.0, math.log(t2 / t1) / math.log(n2 / n1))
+    return t2 * (n / n2) ** exponent
+
+
+def run_suite(cases: List[Case], sizes: List[int], seed: int, repeat: int,
+              budget: float, report=print) -> Dict[str, Dict[str, float]]:
+    """
+    Time every backend of every case over the given sizes.
+
+    A backend stops growing at the first size predicted to take longer
+    than the budget, so quadratic backends stop earlier than linear ones.
+
+    Returns:
+        {"case/backend": {str(n): seconds}}
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for case in cases:
+        for backend in case.backends:
+            key = f"{case.name}/{backend.name}"
+            if backend.needs_numpy and load(backend.module).np is None:
+                report(f"{key:<36} skipped (NumPy not installed)")
+                continue
+
+            timings: Dict[str, float] = {}
+            for n in sizes:
+                if predict(timings, n) > budget:
+                    break
+                timings[str(n)] = time_backend(case, backend, n, seed, repeat)
+                report(f"{key:<36} n={n:<10} {timings[str(n)]:>10.5f} s")
+            results[key] = timings
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """
+    List the measurements that got slower than baseline * threshold.
+    """
+    regressions = []
+    for key, timings in results.items():
+        for n, seconds in timings.items():
+            before = baseline.get(key, {}).get(n)
+            if before is None or max(seconds, before) < NOISE_FLOOR:
+                continue
+            if seconds > before * threshold:
+                regressions.append(f"{key} n={n}: {before:.5f} s -> {seconds:.5f} s "
+                                   f"({seconds / before:.2f}x)")
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    """
+    Describe the machine, so baselines from different hosts are recognizable.
+    """
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = "not installed"
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": str(os.cpu_count()),
+        "numpy": numpy_version,
+    }
+
+
+# ────────────────────────────────────────────────
+# Command Line
+# ────────────────────────────────────────────────
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the suite; return 1 when --compare finds a regression.
+    """
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for 01-two-pointers")
+    parser.add_argument("--cases", nargs="+", choices=[c.name for c in CASES],
+                        help="cases to run (default: all)")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size is 10**min_exp")
+    parser.add_argument("--max-exp", type=int, default=7, help="largest size is 10**max_exp")
+    parser.add_argument("--steps", type=int, default=1, help="sizes per power of ten")
+    parser.add_argument("--repeat", type=int, default=3, help="inputs timed per size (best wins)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=5.0,
+                        help="seconds a single measurement may take before growth stops")
+    parser.add_argument("--save", metavar="JSON", help="write the results as a baseline")
+    parser.add_argument("--compare", metavar="JSON", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown factor that counts as a regression")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in CASES if not args.cases or c.name in args.cases]
+    sizes = sorted({int(round(10 ** (e / args.steps)))
+                    for e in range(args.min_exp * args.steps, args.max_exp * args.steps + 1)})
+
+    results = run_suite(cases, sizes, args.seed, args.repeat, args.budget)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"environment": environment(), "seed": args.seed,
+                       "results": results}, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("environment") != environment():
+            print("Warning: baseline was recorded in a different environment")
+        regressions = compare(results, baseline["results"], args.threshold)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            return 1
+        print("No regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Importable facade for the numbered modules in 01-two-pointers.
+
+Files such as 06_3sum.py cannot be imported with a normal import statement,
+so this package adds that directory to its own search path and loads each
+file lazily, on first access of one of its functions:
+
+    import two_pointers
+    two_pointers.three_sum([-1, 0, 1, 2, -1, -4])   # loads 06_3sum.py only
+
+Nothing is loaded by `import two_pointers` itself, and every name is the
+function of the same name. The backend is picked by input type inside the
+functions, so each keeps its contract: a list given to three_sum is always
+searched by the reference scan (floats, big ints and the in-place sort
+included), while an integer NumPy array goes to three_sum_numpy; the same
+holds for sort_colors, remove_element and sorted_squares. NumPy itself is
+imported only by the code paths that work on arrays, so list input never
+pays for loading it.
+
+two_pointers.instrument.enable() switches the facade to operation-counting
+copies of the same functions (see two_pointers/instrument.py).
+"""
+import importlib
+from pathlib import Path
+
+# Load the numbered files as submodules of this package
+# (two_pointers.06_3sum, ...), which also keeps them picklable for the
+# process pool of three_sum_parallel
+__path__.append(str(Path(__file__).resolve().parent.parent / "01-two-pointers"))
+
+# Public name -> (file stem, function)
+_EXPORTS = {
+    "is_palindrome": ("01_valid_palindrome", "is_palindrome"),
+    "is_palindrome_file": ("01_valid_palindrome", "is_palindrome_file"),
+    "is_palindrome_batch": ("01_valid_palindrome", "is_palindrome_batch"),
+    "PalindromeIndex": ("01_valid_palindrome", "PalindromeIndex"),
+    "reverse_string": ("02_reverse_string", "reverse_string"),
+    "reverse_buffer": ("02_reverse_string", "reverse_buffer"),
+    "reverse_file": ("02_reverse_string", "reverse_file"),
+    "remove_element": ("03_remove_element", "remove_element"),
+    "remove_elements": ("03_remove_element", "remove_elements"),
+    "remove_duplicates": ("04_remove_duplicates_from_sorted_array", "remove_duplicates"),
+    "iter_unique": ("04_remove_duplicates_from_sorted_array", "iter_unique"),
+    "merge_unique": ("04_remove_duplicates_from_sorted_array", "merge_unique"),
+    "dedupe_sorted_files": ("04_remove_duplicates_from_sorted_array", "dedupe_sorted_files"),
+    "SortedUnique": ("04_remove_duplicates_from_sorted_array", "SortedUnique"),
+    "sorted_squares": ("05_squares_of_a_sorted_array", "sorted_squares"),
+    "sorted_transform": ("05_squares_of_a_sorted_array", "sorted_transform"),
+    "three_sum": ("06_3sum", "three_sum"),
+    "three_sum_counts": ("06_3sum", "three_sum_counts"),
+    "iter_three_sum": ("06_3sum", "iter_three_sum"),
+    "count_three_sum": ("06_3sum", "count_three_sum"),
+    "three_sum_parallel": ("06_3sum", "three_sum_parallel"),
+    "three_sum_numpy": ("06_3sum", "three_sum_numpy"),
+    "ThreeSumIndex": ("06_3sum", "ThreeSumIndex"),
+    "k_sum": ("06_3sum", "k_sum"),
+    "k_sum_closest": ("06_3sum", "k_sum_closest"),
+    "sort_colors": ("07_sort_colors", "sort_colors"),
+    "sort_colors_k": ("07_sort_colors", "sort_colors_k"),
+    "partition_by_key": ("07_sort_colors", "partition_by_key"),
+    "compress": ("08_string_compression", "compress"),
+    "compress_buffer": ("08_string_compression", "compress_buffer"),
+    "encode_runs": ("08_string_compression", "encode_runs"),
+    "iter_encode": ("08_string_compression", "iter_encode"),
+    "iter_decode": ("08_string_compression", "iter_decode"),
+    "encode_file": ("08_string_compression", "encode_file"),
+    "decode_file": ("08_string_compression", "decode_file"),
+    "RunLengthSequence": ("08_string_compression", "RunLengthSequence"),
+}
+
+__all__ = sorted(_EXPORTS)
+
+# Set by instrument.enable() / instrument.disable()
+_instrumented = False
+
+
+def load_module(stem: str):
+    """
+    Import one numbered file, e.g. load_module("06_3sum").
+    """
+    return importlib.import_module(f"{__name__}.{stem}")
+
+
+def reference(name: str):
+    """
+    Return the uninstrumented implementation behind a public name, even
+    while two_pointers.instrument is enabled.
+    """
+    stem, attr = _EXPORTS[name]
+    return getattr(load_module(stem), attr)
+
+
+def __getattr__(name: str):
+    """
+    Load the module behind `name` on first access and cache the function.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    stem, attr = _EXPORTS[name]
+    if _instrumented:
+        # Count operations of the reference implementation itself
+        from . import instrument
+        module = instrument.load_module(stem)
+    else:
+        module = load_module(stem)
+
+    function = getattr(module, attr)
+    globals()[name] = function   # later lookups skip __getattr__
+    return function
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,9 @@
+"""
+python -m two_pointers <function> [input.jsonl] - see two_pointers/batch.py.
+"""
+import sys
+
+from two_pointers.batch import main
+
+if __name__ == "__main__":
+    sys.exit(main())
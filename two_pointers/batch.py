@@ -0,0 +1,255 @@
+"""
+Batch runner: apply one function to every record of a JSONL stream.
+
+    python -m two_pointers three_sum inputs.jsonl > results.jsonl
+    cat inputs.jsonl | python -m two_pointers is_palindrome - --unordered
+
+Each input line is one call:
+- a JSON list is passed as positional arguments:  [[-1, 0, 1, 2, -1, -4]]
+- a JSON object is passed as keyword arguments:   {"nums": [3, 2, 2, 3], "val": 3}
+- anything else is passed as the only argument:   "race a car"
+
+Each output line is {"index": i, "result": ...} where i is the position of
+the record among the non-blank input lines, or {"index": i, "error": "..."}
+when the call raised. With --echo-args the arguments are echoed back after
+the call, which shows the result of in-place functions such as sort_colors.
+
+Approach:
+- Lines are grouped into chunks of --chunk-size and each chunk is one task,
+  so pickling cost is paid per chunk and not per record; workers parse the
+  JSON and serialize the results themselves
+- At most --max-pending chunks are in flight at any time. The reader stops
+  until a chunk is written out, which bounds memory on inputs of any length
+- Ordered mode (default) writes chunks in input order, waiting for the
+  oldest one; --unordered writes whichever chunk finishes first
+Time: O(total work / workers) - plus one pass over the input for the reader.
+Space: O(max_pending * chunk_size) - records held in memory at once.
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import two_pointers
+
+# Default number of records sent to a worker per task
+DEFAULT_CHUNK_SIZE = 256
+
+# Default number of in-flight chunks per worker
+PENDING_PER_WORKER = 2
+
+# Function applied by this process (set once per worker)
+_function = None
+
+
+# ────────────────────────────────────────────────
+# Worker Side
+# ────────────────────────────────────────────────
+def _init_worker(name: str) -> None:
+    """
+    Process pool initializer: resolve the function once per worker.
+    """
+    global _function
+    _function = getattr(two_pointers, name)
+
+
+def _to_json(value):
+    """
+    json.dumps fallback for NumPy arrays/scalars, generators (iter_unique,
+    iter_encode, ...), bytes and other non-JSON results.
+    """
+    if hasattr(value, "__next__"):
+        return list(value)
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("latin-1")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return repr(value)
+
+
+def _call(record):
+    """
+    Call the worker's function with one decoded record.
+    """
+    if isinstance(record, list):
+        return _function(*record)
+    if isinstance(record, dict):
+        return _function(**record)
+    return _function(record)
+
+
+def _run_chunk(task: Tuple[int, List[str], bool]) -> str:
+    """
+    Run one chunk of raw input lines and return its JSONL output.
+
+    Args:
+        task: (index of the first record, raw JSON lines, echo arguments?)
+
+    Returns:
+        str: One output line per input line, newline terminated
+    """
+    start, lines, echo_args = task
+    out = []
+    for index, line in enumerate(lines, start):
+        entry = {"index": index}
+        try:
+            record = json.loads(line)
+            result = _call(record)
+            # Generators run here, inside the try, so their errors are
+            # reported for this record
+            if hasattr(result, "__next__"):
+                result = list(result)
+            entry["result"] = result
+            if echo_args:
+                entry["args"] = record
+            text = json.dumps(entry, default=_to_json)
+        except Exception as e:  # one bad record must not stop the batch
+            text = json.dumps({"index": index, "error": f"{type(e).__name__}: {e}"})
+        out.append(text)
+    return "\n".join(out) + "\n"
+
+
+# ────────────────────────────────────────────────
+# Driver Side
+# ────────────────────────────────────────────────
+def _chunks(lines: Iterable[str], chunk_size: int,
+            echo_args: bool) -> Iterator[Tuple[int, List[str], bool]]:
+    """
+    Lazily group the non-blank input lines into tasks.
+    """
+    records = (line for line in lines if line.strip())
+    start = 0
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk, echo_args
+        start += len(chunk)
+
+
+def run_batch(name: str, lines: Iterable[str], out: TextIO,
+              workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE,
+              max_pending: Optional[int] = None,
+              ordered: bool = True,
+              echo_args: bool = False) -> int:
+    """
+    Apply two_pointers.<name> to every JSON line of `lines`, writing JSONL.
+
+    Args:
+        name (str): Public function name, e.g. "three_sum"
+        lines: Input lines (a file object works)
+        out: Text stream the results are written to
+        workers (int): Worker processes; 0 or 1 runs in this process
+            (default: os.cpu_count())
+        chunk_size (int): Records per task
+        max_pending (int): Chunks in flight at once
+            (default: PENDING_PER_WORKER per worker)
+        ordered (bool): Keep the input order in the output
+        echo_args (bool): Echo the (possibly mutated) arguments
+
+    Returns:
+        int: Number of records processed
+    """
+    if name not in two_pointers.__all__:
+        raise ValueError(f"unknown function {name!r}; choose from {', '.join(two_pointers.__all__)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tasks = _chunks(lines, chunk_size, echo_args)
+    count = 0
+
+    # Single process: no pool, no pickling
+    if workers <= 1:
+        _init_worker(name)
+        for task in tasks:
+            out.write(_run_chunk(task))
+            count += len(task[1])
+        return count
+
+    max_pending = max(1, max_pending or PENDING_PER_WORKER * workers)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(name,)) as pool:
+        pending = deque()   # (future, records in chunk), oldest first
+
+        for task in tasks:
+            # Back-pressure: wait for room before reading more input
+            while len(pending) >= max_pending:
+                count += _drain(pending, out, ordered)
+            pending.append((pool.submit(_run_chunk, task), len(task[1])))
+
+        while pending:
+            count += _drain(pending, out, ordered)
+
+    return count
+
+
+def _drain(pending: deque, out: TextIO, ordered: bool) -> int:
+    """
+    Write at least one finished chunk and drop it from `pending`.
+
+    Returns:
+        int: Number of records written
+    """
+    if ordered:
+        future, size = pending.popleft()
+        out.write(future.result())
+        return size
+
+    done, _ = wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+    written = 0
+    for entry in list(pending):
+        if entry[0] in done:
+            pending.remove(entry)
+            out.write(entry[0].result())
+            written += entry[1]
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (python -m two_pointers).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m two_pointers",
+        description="Apply a two_pointers function to every record of a JSONL input")
+    parser.add_argument("function", choices=two_pointers.__all__, metavar="function",
+                        help="public function name, e.g. three_sum")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSONL file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes; 0 or 1 runs in-process (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="records per task")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help=f"chunks in flight (default: {PENDING_PER_WORKER} per worker)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write results as they finish instead of in input order")
+    parser.add_argument("--echo-args", action="store_true",
+                        help="echo the arguments after the call (shows in-place results)")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        run_batch(args.function, source, out,
+                  workers=args.workers,
+                  chunk_size=args.chunk_size,
+                  max_pending=args.max_pending,
+                  ordered=not args.unordered,
+                  echo_args=args.echo_args)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
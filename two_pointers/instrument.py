@@ -0,0 +1,370 @@
+"""
+Opt-in operation counting for the 01-two-pointers functions.
+
+Nothing here touches the regular modules. When instrumentation is enabled,
+the facade serves functions from *instrumented copies* of the numbered
+files instead: their source is rewritten once, at load time, so that
+
+- pointer_moves  counts `p += ...` / `p -= ...` on names the function
+                 uses as a subscript index (so not `count += 1`), and every
+                 iteration of a `for p in range(...)` loop
+- comparisons    counts comparisons that involve an element (a subscript,
+                 or a variable assigned from one), e.g. nums[i] == nums[i - 1]
+                 or current_sum < target, but not pointer checks like low < high
+- writes         counts assignments to a subscript, e.g. nums[k] = nums[j]
+- swaps          counts tuple swaps, e.g. a[i], a[j] = a[j], a[i]
+
+Every public function of an instrumented module also records its number of
+calls and wall time. Counts are attributed to the innermost public function
+running, and are also kept per source line, so e.g. the share of three_sum
+spent in its duplicate-skipping loops is visible.
+
+Usage:
+    import two_pointers
+    from two_pointers import instrument
+
+    instrument.enable()
+    two_pointers.three_sum([-1, 0, 1, 2, -1, -4])
+    print(instrument.snapshot()["three_sum"])
+    print(instrument.render_prometheus())
+    instrument.disable()
+
+When disabled (the default) the facade returns the original functions, so
+there is no cost at all. Functions imported with `from two_pointers import
+...` before enable() keep pointing at the originals. Work done in other
+processes (three_sum_parallel's pool) is not counted.
+"""
+import ast
+import functools
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import two_pointers
+
+KINDS = ("pointer_moves", "comparisons", "writes", "swaps")
+
+_lock = threading.Lock()
+_local = threading.local()
+
+# function name -> aggregated counters over every call
+_totals: Dict[str, Counter] = {}
+# function name -> (kind, line) -> count, over every call
+_lines: Dict[str, Counter] = {}
+# function name -> counters of its most recent call
+_last_call: Dict[str, Counter] = {}
+
+# file stem -> instrumented module
+_modules: Dict[str, object] = {}
+
+
+# ────────────────────────────────────────────────
+# Counting Hooks (called from the instrumented code)
+# ────────────────────────────────────────────────
+def _active() -> List[Tuple[Counter, Counter]]:
+    """
+    Per-thread stack of (counts, per-line counts) of the running calls.
+    """
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _tick(kind: str, line: int) -> None:
+    """
+    Count one operation of `kind` at source line `line`.
+    """
+    stack = _active()
+    if stack:
+        counts, lines = stack[-1]
+        counts[kind] += 1
+        lines[kind, line] += 1
+
+
+def _compared(value, line: int):
+    """
+    Count one element comparison and pass its result through.
+    """
+    _tick("comparisons", line)
+    return value
+
+
+def _timed(name: str, function):
+    """
+    Wrap a public function so every call records its counts and wall time.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        counts, lines = Counter(), Counter()
+        stack = _active()
+        stack.append((counts, lines))
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            stack.pop()
+            counts["calls"] = 1
+            counts["nanoseconds"] = int(seconds * 1e9)
+            with _lock:
+                _totals.setdefault(name, Counter()).update(counts)
+                _lines.setdefault(name, Counter()).update(lines)
+                _last_call[name] = counts
+
+    return wrapper
+
+
+# ────────────────────────────────────────────────
+# Source Rewriting
+# ────────────────────────────────────────────────
+def _contains(node: ast.AST, names: Set[str]) -> bool:
+    """
+    True when the expression reads a subscript or one of `names`.
+    """
+    for child in ast.walk(node):
+        if isinstance(child, ast.Subscript):
+            return True
+        if isinstance(child, ast.Name) and child.id in names:
+            return True
+    return False
+
+
+def _element_names(function: ast.AST) -> Set[str]:
+    """
+    Names in a function that hold elements: loop variables over a sequence
+    (not over range()) and variables assigned from a subscript or from
+    another element variable.
+    """
+    names: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for node in ast.walk(function):
+            targets: List[ast.AST] = []
+            if isinstance(node, ast.Assign) and _contains(node.value, names):
+                targets = node.targets
+            elif isinstance(node, (ast.For, ast.comprehension)) and not _is_range(node.iter):
+                targets = [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name) and name.id not in names:
+                        names.add(name.id)
+                        changed = True
+    return names
+
+
+def _index_names(function: ast.AST) -> Set[str]:
+    """
+    Names a function uses inside a subscript index or slice, e.g. i and j
+    in nums[i] or nums[i:j + 1]: the variables that act as pointers.
+    """
+    names: Set[str] = set()
+    for node in ast.walk(function):
+        if isinstance(node, ast.Subscript):
+            names.update(child.id for child in ast.walk(node.slice)
+                         if isinstance(child, ast.Name))
+    return names
+
+
+def _is_range(node: ast.AST) -> bool:
+    return isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+        and node.func.id == "range"
+
+
+def _tick_statement(kind: str, node: ast.AST) -> ast.stmt:
+    """
+    Build `__tp_tick__(kind, line)` as a statement.
+    """
+    call = ast.Call(func=ast.Name("__tp_tick__", ast.Load()),
+                    args=[ast.Constant(kind), ast.Constant(node.lineno)], keywords=[])
+    return ast.copy_location(ast.Expr(call), node)
+
+
+class _Instrumenter(ast.NodeTransformer):
+    """
+    Insert counting hooks into every function body of a module.
+    """
+
+    def __init__(self) -> None:
+        self.element_names: List[Set[str]] = []
+        self.index_names: List[Set[str]] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        self.element_names.append(_element_names(node))
+        self.index_names.append(_index_names(node))
+        self.generic_visit(node)
+        self.element_names.pop()
+        self.index_names.pop()
+        return node
+
+    def visit_AugAssign(self, node: ast.AugAssign):
+        self.generic_visit(node)
+        if not self.element_names:
+            return node
+        if isinstance(node.target, ast.Subscript):
+            return [node, _tick_statement("writes", node)]
+        if isinstance(node.target, ast.Name) and isinstance(node.op, (ast.Add, ast.Sub)) \
+                and node.target.id in self.index_names[-1]:
+            return [node, _tick_statement("pointer_moves", node)]
+        return node
+
+    def visit_Assign(self, node: ast.Assign):
+        self.generic_visit(node)
+        if not self.element_names:
+            return node
+        for target in node.targets:
+            if isinstance(target, ast.Tuple) and len(target.elts) > 1 \
+                    and all(isinstance(e, ast.Subscript) for e in target.elts):
+                return [node, _tick_statement("swaps", node)]
+        if any(isinstance(target, ast.Subscript) for target in node.targets):
+            return [node, _tick_statement("writes", node)]
+        return node
+
+    def visit_For(self, node: ast.For) -> ast.AST:
+        self.generic_visit(node)
+        if self.element_names and _is_range(node.iter):
+            node.body.insert(0, _tick_statement("pointer_moves", node))
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if not self.element_names or not _contains(node, self.element_names[-1]):
+            return node
+        call = ast.Call(func=ast.Name("__tp_compared__", ast.Load()),
+                        args=[node, ast.Constant(node.lineno)], keywords=[])
+        return ast.copy_location(call, node)
+
+
+def load_module(stem: str):
+    """
+    Return the instrumented copy of one numbered file, e.g. "06_3sum".
+    """
+    if stem in _modules:
+        return _modules[stem]
+
+    path = Path(two_pointers.load_module(stem).__file__)
+    tree = _Instrumenter().visit(ast.parse(path.read_text(encoding="utf-8"), str(path)))
+    ast.fix_missing_locations(tree)
+
+    # Registered under its own name so its functions stay picklable in
+    # this process (and in forked children)
+    name = f"{two_pointers.__name__}._instrumented_{stem}"
+    module = type(sys)(name)
+    module.__file__ = str(path)
+    module.__tp_tick__ = _tick
+    module.__tp_compared__ = _compared
+    sys.modules[name] = module
+    exec(compile(tree, str(path), "exec"), module.__dict__)
+
+    # Time every public function defined by the module
+    for attr, value in list(vars(module).items()):
+        if isinstance(value, types.FunctionType) and not attr.startswith("_") \
+                and getattr(value, "__module__", None) == name:
+            setattr(module, attr, _timed(attr, value))
+
+    _modules[stem] = module
+    return module
+
+
+# ────────────────────────────────────────────────
+# Switching and Export
+# ────────────────────────────────────────────────
+def _forget_cached_functions() -> None:
+    """
+    Drop the functions the facade cached, so the next access picks the
+    (non-)instrumented variant.
+    """
+    for name in two_pointers.__all__:
+        two_pointers.__dict__.pop(name, None)
+
+
+def enable() -> None:
+    """
+    Make the facade return instrumented functions from now on.
+    """
+    two_pointers._instrumented = True
+    _forget_cached_functions()
+
+
+def disable() -> None:
+    """
+    Make the facade return the original functions again.
+    """
+    two_pointers._instrumented = False
+    _forget_cached_functions()
+
+
+def reset() -> None:
+    """
+    Clear every counter.
+    """
+    with _lock:
+        _totals.clear()
+        _lines.clear()
+        _last_call.clear()
+
+
+def snapshot() -> Dict[str, Dict[str, float]]:
+    """
+    Aggregated counters per function: calls, seconds and one entry per
+    operation kind.
+    """
+    with _lock:
+        result = {}
+        for name, counts in _totals.items():
+            entry = {"calls": counts["calls"], "seconds": counts["nanoseconds"] / 1e9}
+            entry.update({kind: counts[kind] for kind in KINDS})
+            result[name] = entry
+        return result
+
+
+def last_call(name: str) -> Optional[Dict[str, float]]:
+    """
+    Counters and wall time of the most recent call of one function.
+    """
+    with _lock:
+        counts = _last_call.get(name)
+        if counts is None:
+            return None
+        entry = {"seconds": counts["nanoseconds"] / 1e9}
+        entry.update({kind: counts[kind] for kind in KINDS})
+        return entry
+
+
+def by_line(name: str) -> Dict[Tuple[str, int], int]:
+    """
+    Aggregated counters of one function, split by (kind, source line).
+    """
+    with _lock:
+        return dict(_lines.get(name, {}))
+
+
+def render_prometheus() -> str:
+    """
+    Render the aggregated counters in the Prometheus text format.
+    """
+    stats = snapshot()
+    lines = [
+        "# HELP two_pointers_calls_total Calls of each instrumented function.",
+        "# TYPE two_pointers_calls_total counter",
+    ]
+    lines += [f'two_pointers_calls_total{{function="{name}"}} {entry["calls"]}'
+              for name, entry in sorted(stats.items())]
+    lines += [
+        "# HELP two_pointers_seconds_total Wall time spent in each function.",
+        "# TYPE two_pointers_seconds_total counter",
+    ]
+    lines += [f'two_pointers_seconds_total{{function="{name}"}} {entry["seconds"]:.9f}'
+              for name, entry in sorted(stats.items())]
+    lines += [
+        "# HELP two_pointers_operations_total Pointer moves, element comparisons, writes and swaps.",
+        "# TYPE two_pointers_operations_total counter",
+    ]
+    lines += [f'two_pointers_operations_total{{function="{name}",kind="{kind}"}} {entry[kind]}'
+              for name, entry in sorted(stats.items()) for kind in KINDS]
+    return "\n".join(lines) + "\n"
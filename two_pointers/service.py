@@ -0,0 +1,572 @@
+"""
+Local asyncio service that micro-batches calls to the two_pointers functions.
+
+    python -m two_pointers.service serve --port 8765
+    python -m two_pointers.service serve --unix /tmp/two_pointers.sock
+    python -m two_pointers.service bench --port 8765 --function is_palindrome
+
+Protocol: JSON lines over TCP or a Unix socket. A connection may send many
+requests without waiting; responses come back as each call finishes, so
+they are matched by "id":
+
+    -> {"id": 1, "function": "three_sum", "args": [[-1, 0, 1, 2, -1, -4]]}
+    <- {"id": 1, "result": [[-1, -1, 2], [-1, 0, 1]]}
+    -> {"id": 2, "function": "sort_colors", "kwargs": {"colors": [2, 0, 1]}, "echo_args": true}
+    <- {"id": 2, "result": [0, 1, 2], "args": {"colors": [0, 1, 2]}}
+    -> {"id": 3, "function": "__stats__"}
+    <- {"id": 3, "result": {"three_sum": {"requests": 1, ...}, ...}}
+
+Generator results (iter_unique, iter_decode, ...) are sent as lists. A
+line longer than --line-limit bytes is answered with {"id": null, "error":
+...} and skipped; the connection stays open.
+
+Approach:
+- One batcher per function collects concurrent requests; a batch is sent
+  as soon as it holds --max-batch calls, or --window seconds after its
+  first call arrived, whichever comes first
+- A batch is one task for the worker pool (or runs inline with
+  --workers 0), so the per-call cost is a loop iteration instead of a
+  process round-trip; functions with a batch backend
+  (is_palindrome -> is_palindrome_batch) get the whole batch in one call
+- Every batcher records the queue depth seen by each new request, the size
+  of every batch (both as power-of-two histograms) and the latency of the
+  last LATENCY_SAMPLES requests, reported by the __stats__ request
+- A larger window/batch trades latency for throughput; the bench command
+  measures both for given settings
+Time: O(batch work / workers) - per batch, plus O(1) per request to queue it.
+Space: O(max_batch) - per function, plus the bounded latency samples.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import two_pointers
+from two_pointers.batch import _to_json
+
+# Default largest number of calls sent to the pool together
+DEFAULT_MAX_BATCH = 64
+
+# Default seconds a batch waits for more calls after its first one
+DEFAULT_WINDOW = 0.002
+
+# Latencies kept per function for the percentiles
+LATENCY_SAMPLES = 10000
+
+# Default longest request/response line, in bytes (asyncio's own default
+# of 64 KiB is less than one sorted_squares call on 20000 values)
+DEFAULT_LINE_LIMIT = 1 << 24
+
+# Functions whose whole batch can go to one vectorized call:
+# name -> batch function taking a list of the single positional argument
+BATCH_BACKENDS = {
+    "is_palindrome": "is_palindrome_batch",
+}
+
+# One call: (positional args, keyword args, echo the arguments back?)
+Call = Tuple[list, dict, bool]
+
+
+# ────────────────────────────────────────────────
+# Worker Side
+# ────────────────────────────────────────────────
+def _echo(args: list, kwargs: dict):
+    """
+    Arguments after the call, in the shape the request used.
+    """
+    if not kwargs:
+        return args
+    if not args:
+        return kwargs
+    return {"args": args, "kwargs": kwargs}
+
+
+def _single_argument(call: Call) -> bool:
+    """
+    True when a call is f(one positional argument); never raises, whatever
+    the call holds.
+    """
+    args, kwargs, _ = call
+    return isinstance(args, (list, tuple)) and len(args) == 1 \
+        and isinstance(kwargs, dict) and not kwargs
+
+
+def _run_calls(name: str, calls: List[Call]) -> List[Tuple[str, Any, Any]]:
+    """
+    Run one batch of calls to two_pointers.<name>.
+
+    Returns:
+        List of ("result", value, args) or ("error", message, None), one
+        per call; args is only filled in when the call asked for it
+    """
+    # Batch backend: every call is f(one positional argument)
+    backend = BATCH_BACKENDS.get(name)
+    if backend is not None and all(map(_single_argument, calls)):
+        try:
+            results = getattr(two_pointers, backend)([args[0] for args, _, _ in calls])
+            if hasattr(results, "tolist"):
+                results = results.tolist()
+            return [("result", value, _echo(args, kwargs) if echo else None)
+                    for value, (args, kwargs, echo) in zip(results, calls)]
+        except Exception:
+            pass    # e.g. a non-string argument: report it per call below
+
+    function = getattr(two_pointers, name)
+    out = []
+    for args, kwargs, echo in calls:
+        try:
+            value = function(*args, **kwargs)
+            # Run generators (iter_unique, iter_decode, ...) here: their
+            # errors belong to this call, and lists can be pickled back
+            if hasattr(value, "__next__"):
+                value = list(value)
+            out.append(("result", value, _echo(args, kwargs) if echo else None))
+        except Exception as e:  # one bad call must not fail the batch
+            out.append(("error", f"{type(e).__name__}: {e}", None))
+    return out
+
+
+# ────────────────────────────────────────────────
+# Metrics
+# ────────────────────────────────────────────────
+class Histogram:
+    """
+    Counts of values in power-of-two buckets (<= 1, <= 2, <= 4, ...).
+    """
+
+    def __init__(self) -> None:
+        self._counts = Counter()
+
+    def add(self, value: int) -> None:
+        self._counts[1 << max(0, int(value) - 1).bit_length()] += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        return {f"<={bound}": self._counts[bound] for bound in sorted(self._counts)}
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of a sorted list (0.0 when empty).
+    """
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(q / 100 * len(samples)))]
+
+
+# ────────────────────────────────────────────────
+# Micro-Batching
+# ────────────────────────────────────────────────
+class Batcher:
+    """
+    Collects calls to one function and runs them in micro-batches.
+    """
+
+    def __init__(self, name: str, executor: Optional[Executor],
+                 max_batch: int, window: float) -> None:
+        self.name = name
+        self._executor = executor
+        self._max_batch = max_batch
+        self._window = window
+
+        self._pending: List[Tuple[Call, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running = set()   # batches in flight (keeps their tasks alive)
+
+        self.requests = 0
+        self.batches = 0
+        self.queue_depth = Histogram()
+        self.batch_size = Histogram()
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    async def submit(self, args: list, kwargs: dict, echo: bool = False) -> Tuple[str, Any, Any]:
+        """
+        Queue one call and wait for its ("result" | "error", value, args).
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        start = time.perf_counter()
+
+        self.requests += 1
+        self.queue_depth.add(len(self._pending))
+        self._pending.append(((args, kwargs, echo), future, start))
+
+        # Size bound: send now; time bound: send when the window closes
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        outcome = await future
+        self.latencies.append(time.perf_counter() - start)
+        return outcome
+
+    def _flush(self) -> None:
+        """
+        Send everything pending as one batch.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.batch_size.add(len(batch))
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[Call, asyncio.Future, float]]) -> None:
+        calls = [call for call, _, _ in batch]
+        try:
+            if self._executor is None:
+                outcomes = _run_calls(self.name, calls)
+            else:
+                loop = asyncio.get_running_loop()
+                outcomes = await loop.run_in_executor(self._executor, _run_calls, self.name, calls)
+        except Exception as e:  # e.g. a result that cannot be pickled back
+            outcomes = [("error", f"{type(e).__name__}: {e}", None)] * len(batch)
+
+        for (_, future, _), outcome in zip(batch, outcomes):
+            if not future.done():
+                future.set_result(outcome)
+
+    def stats(self) -> Dict[str, Any]:
+        samples = sorted(self.latencies)
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "queued": len(self._pending),
+            "queue_depth": self.queue_depth.as_dict(),
+            "batch_size": self.batch_size.as_dict(),
+            "latency_p50_ms": _percentile(samples, 50) * 1e3,
+            "latency_p99_ms": _percentile(samples, 99) * 1e3,
+        }
+
+
+# ────────────────────────────────────────────────
+# Server
+# ────────────────────────────────────────────────
+async def _read_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Next line of a stream (b"" at EOF), or None when it was longer than the
+    reader's limit; the whole long line is then skipped, so the next call
+    starts at the following line.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial                # last line without a newline
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+
+    # readline() would drop only the buffered part of the line, and the rest
+    # would be read as the next line; drop everything up to the newline
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+
+class Service:
+    """
+    JSON-lines server with one Batcher per function.
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 max_batch: int = DEFAULT_MAX_BATCH,
+                 window: float = DEFAULT_WINDOW,
+                 line_limit: int = DEFAULT_LINE_LIMIT) -> None:
+        """
+        Args:
+            workers: Worker processes; 0 runs batches in the event loop
+                (default: os.cpu_count())
+            max_batch: Largest batch size
+            window: Seconds a batch waits for more calls
+            line_limit: Longest request line in bytes; longer ones get an
+                error response and the connection stays usable
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(workers) if workers > 0 else None
+        self._max_batch = max_batch
+        self._window = window
+        self._line_limit = line_limit
+        self._batchers: Dict[str, Batcher] = {}
+
+    def _batcher(self, name: str) -> Batcher:
+        if name not in self._batchers:
+            self._batchers[name] = Batcher(name, self._executor, self._max_batch, self._window)
+        return self._batchers[name]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Per-function request counts, histograms and latency percentiles.
+        """
+        return {name: batcher.stats() for name, batcher in sorted(self._batchers.items())}
+
+    async def _respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response = {"id": request.get("id")}
+        name = request.get("function")
+
+        if name == "__stats__":
+            response["result"] = self.stats()
+        elif name not in two_pointers.__all__:
+            response["error"] = f"unknown function {name!r}"
+        elif not isinstance(request.get("args", []), list):
+            response["error"] = "bad request: args must be a JSON list"
+        elif not isinstance(request.get("kwargs", {}), dict):
+            response["error"] = "bad request: kwargs must be a JSON object"
+        else:
+            # Only well-formed calls reach a batcher, so none can fail the
+            # others queued with it
+            kind, value, args = await self._batcher(name).submit(
+                request.get("args", []), request.get("kwargs", {}),
+                bool(request.get("echo_args")))
+            response[kind] = value
+            if args is not None:
+                response["args"] = args
+        return response
+
+    async def _answer(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+            response = await self._respond(request)
+        except ValueError as e:
+            response = {"id": None, "error": f"bad request: {e}"}
+        await self._send(response, writer)
+
+    @staticmethod
+    async def _send(response: Dict[str, Any], writer: asyncio.StreamWriter) -> None:
+        try:
+            data = json.dumps(response, default=_to_json)
+        except (TypeError, ValueError) as e:   # every request gets an answer
+            data = json.dumps({"id": response.get("id"),
+                               "error": f"{type(e).__name__}: {e}"})
+        writer.write(data.encode() + b"\n")
+        await writer.drain()    # back-pressure on slow readers
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection; each request line is answered concurrently.
+        """
+        tasks = set()
+        try:
+            while True:
+                line = await _read_line(reader)
+                if line == b"":
+                    break
+                if line is None:
+                    # Too long to parse, so its id is unknown
+                    answer = self._send({"id": None, "error": "bad request: line longer "
+                                         f"than {self._line_limit} bytes"}, writer)
+                elif line.strip():
+                    answer = self._answer(line, writer)
+                else:
+                    continue
+                task = asyncio.ensure_future(answer)
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    path: Optional[str] = None) -> None:
+        """
+        Serve forever on localhost TCP, or on a Unix socket when path is set.
+        """
+        if path is not None:
+            server = await asyncio.start_unix_server(self._handle, path=path,
+                                                     limit=self._line_limit)
+        else:
+            server = await asyncio.start_server(self._handle, host, port,
+                                                limit=self._line_limit)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+# ────────────────────────────────────────────────
+# Client and Load Generator
+# ────────────────────────────────────────────────
+class Client:
+    """
+    Minimal asyncio client; many calls may be in flight at once.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._waiting: Dict[int, asyncio.Future] = {}
+        self._listener = asyncio.ensure_future(self._listen())
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765,
+                      path: Optional[str] = None,
+                      limit: int = DEFAULT_LINE_LIMIT) -> "Client":
+        """
+        Connect over TCP, or a Unix socket when path is set; limit is the
+        longest response line in bytes.
+        """
+        if path is not None:
+            return cls(*await asyncio.open_unix_connection(path, limit=limit))
+        return cls(*await asyncio.open_connection(host, port, limit=limit))
+
+    async def _listen(self) -> None:
+        error: Exception = ConnectionError("connection closed")
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._waiting.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except Exception as e:  # e.g. a response over the limit
+            error = ConnectionError(f"connection unusable: {type(e).__name__}: {e}")
+        finally:
+            # Nothing will answer the pending calls any more: fail them all
+            for future in self._waiting.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._waiting.clear()
+
+    async def request(self, function: str, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Send one call and return the raw response object.
+        """
+        if self._listener.done():
+            raise ConnectionError("connection closed")
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({"id": request_id, "function": function,
+                                       "args": list(args), "kwargs": kwargs}).encode() + b"\n")
+        return await future
+
+    async def call(self, function: str, *args, **kwargs) -> Any:
+        """
+        Send one call and return its result, raising RuntimeError on error.
+        """
+        response = await self.request(function, *args, **kwargs)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    async def close(self) -> None:
+        self._writer.close()
+        self._listener.cancel()
+
+
+# Small inputs for the load generator
+BENCH_INPUTS = {
+    "is_palindrome": ["A man, a plan, a canal: Panama"],
+    "sorted_squares": [[-7, -3, 2, 3, 11]],
+    "three_sum": [[-1, 0, 1, 2, -1, -4]],
+    "compress": [list("aabbccc")],
+}
+
+
+async def bench(function: str = "is_palindrome", requests: int = 10000,
+                concurrency: int = 64, host: str = "127.0.0.1", port: int = 8765,
+                path: Optional[str] = None,
+                limit: int = DEFAULT_LINE_LIMIT) -> Dict[str, float]:
+    """
+    Send `requests` calls with `concurrency` callers; report throughput and
+    end-to-end latency percentiles.
+    """
+    client = await Client.connect(host, port, path, limit)
+    args = BENCH_INPUTS.get(function, [])
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def caller() -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            await client.call(function, *args)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+
+    latencies.sort()
+    return {
+        "requests_per_second": requests / elapsed,
+        "latency_p50_ms": _percentile(latencies, 50) * 1e3,
+        "latency_p99_ms": _percentile(latencies, 99) * 1e3,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point: serve, or benchmark a running server.
+    """
+    parser = argparse.ArgumentParser(prog="python -m two_pointers.service",
+                                     description="Micro-batching service for two_pointers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("serve", "bench"):
+        sub = commands.add_parser(command)
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--port", type=int, default=8765)
+        sub.add_argument("--unix", metavar="PATH", help="Unix socket instead of TCP")
+        sub.add_argument("--line-limit", type=int, default=DEFAULT_LINE_LIMIT,
+                         help="longest request/response line in bytes")
+
+    serve_args = commands.choices["serve"]
+    serve_args.add_argument("-j", "--workers", type=int, default=None,
+                            help="worker processes; 0 runs batches inline (default: CPU count)")
+    serve_args.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    serve_args.add_argument("--window", type=float, default=DEFAULT_WINDOW,
+                            help="seconds a batch waits for more calls")
+
+    bench_args = commands.choices["bench"]
+    bench_args.add_argument("--function", default="is_palindrome", choices=sorted(BENCH_INPUTS))
+    bench_args.add_argument("--requests", type=int, default=10000)
+    bench_args.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        service = Service(args.workers, args.max_batch, args.window, args.line_limit)
+        try:
+            asyncio.run(service.serve(args.host, args.port, args.unix))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    result = asyncio.run(bench(args.function, args.requests, args.concurrency,
+                               args.host, args.port, args.unix, args.line_limit))
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())